@@ -1,11 +1,26 @@
-
 import bpy
 import re
 import math
 import bmesh
 import mathutils
+import numpy as np
 import pathlib
 import os
+import time
+import functools
+import collections
+import cProfile
+import pstats
+import hashlib
+import json
+import tempfile
+import shutil
+import struct
+import io
+import subprocess
+import concurrent.futures
+import dataclasses
+import xml.etree.ElementTree as ET
 
 
 #----------------OBJECT MODE ONLY--------------------------
@@ -28,32 +43,109 @@ ColliderMaterial_name = "COL_DEFAULT"
 
 GUIDELINES_TEXT_DATA = ""
 
+# "------ Models ------" section headers
+GUIDELINES_SECTION_REGEX = re.compile(r"^-{2,}\s*(.*?)\s*-{2,}\s*$")
+
+
+class GuidelinesCache:
+    """guidelines.txt parsed into sections, reread only when the file changes"""
+
+    def __init__(self):
+        self.path = None
+        self.mtime = None
+        self.text = ""
+        self.sections = {}      # identifier -> (title, lines)
+        self.section_items = [] # EnumProperty items, kept alive for Blender
+
+    def get(self, path):
+        """Sections of the file at path, parsed again only if path or mtime changed"""
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            mtime = None
+        if path != self.path or mtime != self.mtime:
+            self.load(path, mtime)
+        return self.sections
+
+    def load(self, path, mtime):
+        self.path = path
+        self.mtime = mtime
+        if mtime is None:
+            self.text = ""
+        else:
+            with open(path, 'r') as guidelines_file:
+                self.text = guidelines_file.read()
+        self.sections = parse_guidelines(self.text)
+        self.section_items = [(identifier, title, "") for identifier, (title, _) in self.sections.items()]
+
+
+def parse_guidelines(text):
+    """Guidelines text -> {identifier: (title, lines)} in file order"""
+    sections = {}
+    title = "General"
+    lines = []
+
+    def add_section():
+        # Trailing empty lines are dropped
+        while lines and not lines[-1].strip():
+            lines.pop()
+        if lines or title != "General":
+            identifier = re.sub(r"\W+", "_", title.upper()).strip("_") or "SECTION"
+            sections[identifier] = (title, tuple(lines))
+
+    for line in text.splitlines():
+        match = GUIDELINES_SECTION_REGEX.match(line)
+        if match:
+            add_section()
+            title = match.group(1).title()
+            lines = []
+        else:
+            lines.append(line.expandtabs(4))
+    add_section()
+
+    return sections
+
+
+def get_guidelines_path(context):
+    """guidelines.txt next to this script (or the script open in the text editor)"""
+    script_path = __file__
+    
+    # running only if in text editor (Blender editor reasons)
+    if context.space_data != None and context.space_data.type == "TEXT_EDITOR" and context.space_data.text:
+        script_path = context.space_data.text.filepath or __file__
+    
+    return os.path.join(pathlib.Path(script_path).resolve().parent, "guidelines.txt")
+
+
+def get_guidelines_source(context):
+    """Rule set sections (generated from the rule file), guidelines.txt if it has none"""
+    global GUIDELINES_TEXT_DATA
+    source = get_rule_set()
+    if not source.sections:
+        GUIDELINES_CACHE.get(get_guidelines_path(context))
+        source = GUIDELINES_CACHE
+    GUIDELINES_TEXT_DATA = source.text
+    return source
+
+
+def get_guidelines_sections(context):
+    return get_guidelines_source(context).sections
+
+
+def guidelines_section_items(self, context):
+    return get_guidelines_source(context).section_items
+
+
+GUIDELINES_CACHE = GuidelinesCache()
+
+
 class GetGuidelinesFile(bpy.types.Operator):
     bl_idname = "wm.get_guidelines"
     bl_label = "GetGuidelines"
 
     def execute(self, context):
-        global GUIDELINES_TEXT_DATA
-        
-        script_path = __file__
-        
-        # running only if in text editor (Blender editor reasons)
-        if bpy.context.space_data != None and bpy.context.space_data.type == "TEXT_EDITOR":
-            script_path = bpy.context.space_data.text.filepath
-        else:
-            script_path = __file__
-        
-        
-        script_dir = pathlib.Path(script_path).resolve().parent
-
-        guidelines_file = open(os.path.join(script_dir, "guidelines.txt"), 'r')
-        
-        print(guidelines_file)
-
-        GUIDELINES_TEXT_DATA = guidelines_file.read()
-
-        guidelines_file.close()         
-            
+        # Cached until guidelines.txt changes
+        get_guidelines_sections(context)
         return {'FINISHED'}
 
 
@@ -82,13 +174,14 @@ class TEXT_OT_OpenCustomWindow(bpy.types.Operator):
     bl_label = "Open Text Window"
     bl_options = {'REGISTER', 'UNDO'}
     
-    text_data: bpy.props.StringProperty(name="Text Data", default="")
+    section: bpy.props.StringProperty(name="Section", description="Guidelines section shown first", default="")
 
     def execute(self, context):
-        bpy.ops.wm.get_guidelines()
-        self.text_data = GUIDELINES_TEXT_DATA
+        sections = get_guidelines_sections(context)
+        
+        if self.section in sections:
+            context.window_manager.guidelines_section = self.section
         
-        context.window_manager.text_window_text = self.text_data  # Store for UI
         bpy.ops.wm.custom_text_popup('INVOKE_DEFAULT')
         return {'FINISHED'}
 
@@ -103,9 +196,17 @@ class TEXT_OT_CustomTextPopup(bpy.types.Operator):
 
     def draw(self, context):
         layout = self.layout
+        sections = get_guidelines_sections(context)
+        
+        if not sections:
+            layout.label(text="No guidelines found", icon='ERROR')
+            return
+        
+        layout.prop(context.window_manager, "guidelines_section", text="")
         
-        # Display each line separately
-        for line in GUIDELINES_TEXT_DATA.split("\n"):
+        # Only the lines of the selected section, already split
+        _, lines = sections.get(context.window_manager.guidelines_section, next(iter(sections.values())))
+        for line in lines:
             layout.label(text=line)  
 
     def invoke(self, context, event):
@@ -118,7 +219,7 @@ def GuidelinesRegister():
     bpy.utils.register_class(TEXT_OT_OpenCustomWindow)
     bpy.utils.register_class(TEXT_OT_CustomTextPopup)
     bpy.utils.register_class(VIEW3D_PT_CustomPanel)
-    bpy.types.WindowManager.text_window_text = bpy.props.StringProperty(name="Text Window Data", default="")
+    bpy.types.WindowManager.guidelines_section = bpy.props.EnumProperty(name="Guidelines Section", items=guidelines_section_items)
 
 def GuidelinesUnregister():
     bpy.utils.unregister_class(GetGuidelinesFile)
@@ -126,13 +227,180 @@ def GuidelinesUnregister():
     bpy.utils.unregister_class(TEXT_OT_CustomTextPopup)
     bpy.utils.unregister_class(VIEW3D_PT_CustomPanel)
 
-    del bpy.types.WindowManager.text_window_text
+    del bpy.types.WindowManager.guidelines_section
 #---------------------------------------------------
 # /Guidelines
 #---------------------------------------------------
 
 
 
+#---------------------------------------------------
+# Naming Rules
+#---------------------------------------------------
+# Naming conventions from guidelines.json, compiled once per rule set
+
+RULES_FILENAME = "guidelines.json"
+BUNDLED_RULES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), RULES_FILENAME)
+
+# Export mode names used in rule files, "default" applies to the other modes
+RULE_MODES = {"FINAL": 'OP1', "PROTOTYPE": 'OP2', "DESIGN": 'OP3'}
+RULE_DEFAULT_MODE = "default"
+
+# Rules the checks use, a rule file must give each a default pattern
+REQUIRED_RULES = ("MATERIAL",)
+
+# Lists a rule file can declare, usable in patterns as {SCOPES} etc.
+RULE_LISTS = {
+    "scopes": ("SCOPES", "SCOPE"),
+    "texture_types": ("TEXTURE_TYPES", "TEXTURE TYPES"),
+    "empty_types": ("EMPTY_TYPES", "EMPTYS"),
+}
+
+# Built-in rules, not part of the guidelines
+BUILTIN_RULES = {
+    # Blender duplicate suffix (.001), group 1 is the base name
+    "DUPLICATE": {None: re.compile(r'^(.+)\.\d{3}$')},
+}
+
+DUPLICATE_REGEX = BUILTIN_RULES["DUPLICATE"][None]
+
+
+class RuleSet:
+    """Naming rules and guideline sections compiled from one rule file"""
+
+    def __init__(self, path, mtime, data):
+        self.path = path
+        self.mtime = mtime
+        self.lists = {name: dict(data.get(name, {})) for name in RULE_LISTS}
+
+        # Lists as regex alternatives
+        placeholders = {placeholder: "|".join(re.escape(key) for key in self.lists[name])
+                        for name, (placeholder, _) in RULE_LISTS.items()}
+
+        # rule -> {export mode (None = any other mode): compiled pattern}, file patterns override per mode
+        self.rules = {rule: dict(patterns) for rule, patterns in BUILTIN_RULES.items()}
+        for rule, patterns in data.get("rules", {}).items():
+            compiled = self.rules.setdefault(rule, {})
+            for mode_name, pattern in patterns.items():
+                if mode_name != RULE_DEFAULT_MODE and mode_name not in RULE_MODES:
+                    raise ValueError(f"rule {rule}: unknown mode {mode_name}")
+                for placeholder, alternatives in placeholders.items():
+                    pattern = pattern.replace("{" + placeholder + "}", alternatives)
+                compiled[RULE_MODES.get(mode_name)] = re.compile(pattern)
+
+        # Incomplete files fail here (and fall back), not in the checks
+        for rule in REQUIRED_RULES:
+            if None not in self.rules.get(rule, {}):
+                raise ValueError(f"rule {rule}: no {RULE_DEFAULT_MODE} pattern")
+
+        self.section_data = data.get("sections", [])
+        self.sections = {}
+        for section in self.section_data:
+            identifier = re.sub(r"\W+", "_", section["title"].upper()).strip("_")
+            self.sections[identifier] = (section["title"], tuple(self.format_section(section)))
+        self.section_items = [(identifier, title, "") for identifier, (title, _) in self.sections.items()]
+        self.text = "\n".join(line for _, lines in self.sections.values() for line in lines)
+
+    def get_pattern(self, rule, mode=None):
+        patterns = self.rules[rule]
+        return patterns.get(mode, patterns.get(None))
+
+    def format_section(self, section):
+        """Popup lines of a section"""
+        lines = ["RULE:", "    " + section.get("format", "")]
+        if section.get("prototype_format"):
+            lines += ["PROTOTYPE RULE:", "    " + section["prototype_format"]]
+        for name in section.get("lists", ()):
+            lines.append(RULE_LISTS[name][1] + ":")
+            lines += [f"    {key}  ({description})" for key, description in self.lists[name].items()]
+        lines += ["- " + note for note in section.get("notes", ())]
+        if section.get("examples"):
+            lines.append("EXAMPLES:")
+            lines += ["    " + example for example in section["examples"]]
+        return lines
+
+    def check_examples(self):
+        """Examples that don't follow their own section's rule (file drifted from itself)"""
+        invalid = []
+        for section in self.section_data:
+            rule = section.get("rule")
+            if rule in self.rules:
+                pattern = self.get_pattern(rule)
+                invalid += [example for example in section.get("examples", ())
+                            if not pattern.match(os.path.splitext(example)[0])]
+        return invalid
+
+
+def load_rule_set(path):
+    mtime = os.stat(path).st_mtime_ns
+    with open(path, 'r') as rules_file:
+        rule_set = RuleSet(path, mtime, json.load(rules_file))
+    for example in rule_set.check_examples():
+        print(f"BBG rules {path}: example {example} does not match its rule")
+    return rule_set
+
+
+RULE_SET = None
+FAILED_RULES = None     # (path, mtime) of the last rule file that failed to load
+
+
+def get_rules_path():
+    """Rule file from the settings, the bundled guidelines.json if not set"""
+    scene = getattr(bpy.context, "scene", None)
+    other_props = getattr(scene, "other_properties", None)
+    if other_props and other_props.rules_file:
+        return bpy.path.abspath(other_props.rules_file)
+    return BUNDLED_RULES_PATH
+
+
+def get_rule_set():
+    """Active rule set, compiled again only when the file or its mtime changes.
+    A broken rule file is tried again only after its mtime changes"""
+    global RULE_SET, FAILED_RULES
+    path = get_rules_path()
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        mtime = None
+
+    if FAILED_RULES == (path, mtime) and RULE_SET is not None:
+        return RULE_SET
+
+    if RULE_SET is None or RULE_SET.path != path or RULE_SET.mtime != mtime:
+        try:
+            RULE_SET = load_rule_set(path)
+            FAILED_RULES = None
+        except (OSError, ValueError, KeyError, re.error) as error:
+            if path == BUNDLED_RULES_PATH:
+                raise
+            print(f"BBG rules {path}: {error}, using {RULES_FILENAME}")
+            FAILED_RULES = (path, mtime)
+            if RULE_SET is None or RULE_SET.path != BUNDLED_RULES_PATH:
+                RULE_SET = load_rule_set(BUNDLED_RULES_PATH)
+    return RULE_SET
+
+
+def get_naming_rule(rule, mode=None):
+    """Compiled pattern of a naming rule for the export mode"""
+    return get_rule_set().get_pattern(rule, mode)
+
+
+def validate_names(rule, names, mode=None):
+    """Returns the set of names that don't follow the rule"""
+    match = get_naming_rule(rule, mode).match
+    return {name for name in set(names) if not match(name)}
+
+
+def strip_duplicate_suffix(name):
+    """Name without the .00x suffix"""
+    match = DUPLICATE_REGEX.match(name)
+    return match.group(1) if match else name
+
+#---------------------------------------------------
+# /Naming Rules
+#---------------------------------------------------
+
+
 #---------------------------------------------------
 # Checks
 #---------------------------------------------------
@@ -154,11 +422,27 @@ class CheckPanel(bpy.types.Panel):
         rowScale = boxScale.row() 
         rowScale.operator("object.check_scales", text="Scale Check")
         
+        #LIVE BOX
+        other_props = context.scene.other_properties
+        boxLive = layout.box()
+        boxLive.prop(other_props, "live_checks", text="LIVE")
+        if other_props.live_checks:
+            draw_live_checks(boxLive, context)
+        
         #MATERIALS BOX
         boxMaterials = layout.box()
         boxMaterials.label(text="MATERIALS")
         boxMaterials.row().operator("wm.format_check", text="Material Check")
         boxMaterials.row().operator("wm.texture_format_check", text="Texture Check")
+        boxMaterials.row().operator("wm.texture_memory_check", text="Texture Memory")
+        
+        #REPORT
+        layout.row().operator("wm.export_check_report", text="Export Check Report", icon='EXPORT')
+        
+        #PROFILING "header"
+        layout.row().prop(other_props, "show_profiling", text="PROFILING", icon="TRIA_DOWN" if other_props.show_profiling else "TRIA_RIGHT", emboss=False)
+        if other_props.show_profiling:
+            draw_profiles(layout.box())
         
         #CLEAN BOX
         boxClean = layout.box()
@@ -178,6 +462,11 @@ class CheckPanel(bpy.types.Panel):
             rowOther.prop(context.scene.other_properties, "export_mode_enum", text="Mode")
             boxOther.row().prop(context.scene.other_properties, "custom_collider_name", text="Material Name")
             boxOther.row().prop(context.scene, "include_name_MATERIAL", text="Include \"Material\"")
+            boxOther.row().prop(context.scene, "clean_textures_by_content", text="Textures by Content")
+            boxOther.row().prop(context.scene.other_properties, "rules_file", text="Rules")
+            rowTextures = boxOther.row(align=True)
+            rowTextures.prop(context.scene.other_properties, "texture_budget_mb", text="Budget MB")
+            rowTextures.prop(context.scene.other_properties, "texture_max_size", text="Max Size")
             #rowOther.operator("object.check_normals", text="Check Normals")
 
 
@@ -186,6 +475,488 @@ class CheckPanel(bpy.types.Panel):
 #---------------------------------------------------
 
 
+#---------------------------------------------------
+# Scene Index
+#---------------------------------------------------
+# One traversal of the scene shared by all export checks
+
+# _LODn suffix, optionally followed by Blender's .00x duplicate suffix
+LOD_SUFFIX_REGEX = re.compile(r"_LOD(\d+)(?:\.\d{3})?$")
+
+
+class ObjectRecord:
+    """Per-object data collected by the scene index"""
+    __slots__ = ("obj", "name", "type", "root", "position", "materials", "images", "is_col", "is_old", "lod_level")
+
+    def __init__(self, obj, root, position, material_images):
+        self.obj = obj
+        self.name = obj.name
+        self.type = obj.type
+        self.root = root
+        self.position = position  # row in SceneIndex.scales
+
+        # Material names from slots (material format check)
+        self.materials = tuple(slot.material.name for slot in obj.material_slots if slot.material)
+
+        # (material name, image name) pairs from mesh materials (texture check)
+        images = []
+        if obj.data and hasattr(obj.data, "materials"):
+            for mat in obj.data.materials:
+                if mat and mat.node_tree:
+                    images.extend((mat.name, image_name) for image_name in get_material_images(mat, material_images))
+        self.images = tuple(images)
+
+        # Name flags
+        self.is_col = "COL" in self.name
+        self.is_old = self.name.endswith('_OLD')
+        lod_match = LOD_SUFFIX_REGEX.search(self.name)
+        self.lod_level = int(lod_match.group(1)) if lod_match else None
+
+
+def get_material_images(mat, material_images):
+    """Image names used by the material node tree, scanned once per material"""
+    images = material_images.get(mat.name)
+    if images is None:
+        images = tuple(node.image.name for node in mat.node_tree.nodes if node.type == 'TEX_IMAGE' and node.image)
+        material_images[mat.name] = images
+    return images
+
+
+def compute_object_roots(objects):
+    """Object name -> top parent, from a parent -> children map walked top-down
+
+    Parents outside objects (e.g. in excluded collections) are followed up to
+    their own top parent once.
+    """
+    children = {}
+    names = set()
+    tops = []
+    for obj in objects:
+        names.add(obj.name)
+        parent = obj.parent
+        if parent is None:
+            tops.append(obj)
+        else:
+            children.setdefault(parent.name, []).append(obj)
+
+    # (subtree start, its root)
+    stack = [(obj, obj) for obj in tops]
+    for parent_name, parent_children in children.items():
+        if parent_name not in names:
+            root = parent_children[0].parent
+            while root.parent:
+                root = root.parent
+            stack.extend((child, root) for child in parent_children)
+
+    roots = {}
+    while stack:
+        obj, root = stack.pop()
+        roots[obj.name] = root
+        stack.extend((child, root) for child in children.get(obj.name, ()))
+
+    return roots
+
+
+class SceneIndex:
+    """Single-pass index of visible and selected objects used by the checks"""
+
+    def __init__(self, context, mode=None):
+        start = time.perf_counter()
+
+        self.mode = mode if mode is not None else context.scene.other_properties.export_mode_enum
+        self.records = {}
+        self.material_images = {}
+
+        def get_record(obj, position=None):
+            record = self.records.get(obj.name)
+            if record is None:
+                if position is None:
+                    position = layer_objects.find(obj.name)
+                record = ObjectRecord(obj, self.roots[obj.name], position, self.material_images)
+                self.records[obj.name] = record
+            return record
+
+        # World scales of all view layer objects in one bulk read
+        layer_objects = context.view_layer.objects
+        self.scales = get_world_scales(layer_objects)
+
+        # Top parent of every view layer object in one top-down pass
+        self.roots = compute_object_roots(layer_objects)
+
+        self.visible_records = [get_record(obj, position) for position, obj in enumerate(layer_objects) if obj.visible_get()]
+        self.selected_records = [get_record(obj) for obj in context.selected_objects]
+
+        # Objects for material/texture/col/_OLD checks
+        if len(self.selected_records) >= 1:
+            self.check_records = self.selected_records
+        else:
+            self.check_records = [record for record in self.visible_records if record.type == 'MESH']
+
+        self.build_time = time.perf_counter() - start
+        self.check_times = {}
+        profile_visit(len(self.records))
+        profile_check_time("INDEX", self.build_time)
+
+    @property
+    def root_records(self):
+        """Objects for the root check (selection or all visible)"""
+        return self.selected_records if len(self.selected_records) > 1 else self.visible_records
+
+    def run_check(self, name, check, *args):
+        """Run a check and store its time"""
+        start = time.perf_counter()
+        result = check(*args)
+        self.check_times[name] = time.perf_counter() - start
+        profile_check_time(name, self.check_times[name])
+        return result
+
+    def timing_report(self):
+        """Traversal and per-check times as text"""
+        lines = [f"Scene index: {len(self.records)} objects in {self.build_time * 1000:.2f} ms"]
+        for name, seconds in self.check_times.items():
+            lines.append(f"{name}: {seconds * 1000:.2f} ms")
+        return "\n".join(lines)
+
+#---------------------------------------------------
+# /Scene Index
+#---------------------------------------------------
+
+
+#---------------------------------------------------
+# Check Report
+#---------------------------------------------------
+# Structured results of the check operators, exported as JSON or JUnit XML
+
+# Popup icons of the export checks -> severity of a failed check
+ICON_SEVERITIES = {
+    'CANCEL': 'ERROR',
+    'SEQUENCE_COLOR_02': 'WARNING',
+}
+
+
+@dataclasses.dataclass(slots=True)
+class CheckResult:
+    """One check: failed results with ERROR severity fail the report"""
+    check: str
+    passed: bool
+    severity: str = 'ERROR'
+    offenders: tuple = ()
+    message: str = ""
+    time: float = 0.0
+
+
+@dataclasses.dataclass(slots=True)
+class CheckReport:
+    """Results of one check operator run"""
+    operator: str
+    mode: str = ""
+    file: str = ""
+    results: list = dataclasses.field(default_factory=list)
+
+    def add(self, check, passed, offenders=(), severity='ERROR', message="", time=0.0):
+        result = CheckResult(check, bool(passed), severity, tuple(offenders), message, time)
+        self.results.append(result)
+        return result
+
+    @property
+    def passed(self):
+        return all(result.passed or result.severity != 'ERROR' for result in self.results)
+
+    def to_dict(self):
+        return dataclasses.asdict(self)
+
+    @classmethod
+    def from_dict(cls, data):
+        results = [CheckResult(**dict(result, offenders=tuple(result["offenders"]))) for result in data["results"]]
+        return cls(data["operator"], data["mode"], data["file"], results)
+
+    def to_junit(self):
+        """<testsuite>, warnings and infos pass with their text in system-out"""
+        suite = ET.Element("testsuite", name=self.file or "untitled", tests=str(len(self.results)),
+                           failures=str(sum(not result.passed and result.severity == 'ERROR' for result in self.results)),
+                           time=f"{sum(result.time for result in self.results):.6f}")
+        for result in self.results:
+            case = ET.SubElement(suite, "testcase", classname=f"BBG.{self.operator}.{self.mode}", name=result.check,
+                                 time=f"{result.time:.6f}")
+            details = "\n".join(result.offenders)
+            if not result.passed and result.severity == 'ERROR':
+                failure = ET.SubElement(case, "failure", message=result.message or result.check, type=result.severity)
+                failure.text = details
+            elif not result.passed or result.message:
+                ET.SubElement(case, "system-out").text = "\n".join(filter(None, (result.severity, result.message, details)))
+        return suite
+
+
+def write_check_reports_json(path, reports):
+    with open(path, 'w') as report_file:
+        json.dump([report.to_dict() for report in reports], report_file, indent=2)
+
+
+def write_check_reports_junit(path, reports):
+    suites = ET.Element("testsuites")
+    suites.extend(report.to_junit() for report in reports)
+    ET.ElementTree(suites).write(path, encoding="utf-8", xml_declaration=True)
+
+
+# Report of the last check operator run, for the report export
+LAST_CHECK_REPORT = None
+
+
+def new_check_report(operator, context):
+    """Empty report of an operator run, becomes the last report"""
+    global LAST_CHECK_REPORT
+    LAST_CHECK_REPORT = CheckReport(operator, get_export_mode_name(context.scene.other_properties.export_mode_enum), bpy.data.filepath)
+    return LAST_CHECK_REPORT
+
+
+def get_export_mode_name(mode):
+    return {'OP1': "FINAL", 'OP2': "PROTOTYPE", 'OP3': "DESIGN"}.get(mode, "")
+
+
+class ExportCheckReportOperator(bpy.types.Operator):
+    """Export the last check results as JSON or JUnit XML (.xml)"""
+    bl_idname = "wm.export_check_report"
+    bl_label = "Export Check Report"
+
+    filepath: bpy.props.StringProperty(subtype='FILE_PATH')
+    filter_glob: bpy.props.StringProperty(default="*.json;*.xml", options={'HIDDEN'})
+
+    @classmethod
+    def poll(cls, context):
+        return LAST_CHECK_REPORT is not None
+
+    def invoke(self, context, event):
+        if not self.filepath:
+            blend_name = os.path.splitext(os.path.basename(bpy.data.filepath))[0] or "untitled"
+            self.filepath = blend_name + "_checks.json"
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+    def execute(self, context):
+        path = bpy.path.abspath(self.filepath)
+        if path.lower().endswith(".xml"):
+            write_check_reports_junit(path, [LAST_CHECK_REPORT])
+        else:
+            write_check_reports_json(path, [LAST_CHECK_REPORT])
+        self.report({'INFO'}, f"Check report written to {self.filepath}")
+        return {'FINISHED'}
+
+
+def CheckReportRegister():
+    bpy.utils.register_class(ExportCheckReportOperator)
+
+def CheckReportUnregister():
+    bpy.utils.unregister_class(ExportCheckReportOperator)
+
+#---------------------------------------------------
+# /Check Report
+#---------------------------------------------------
+
+
+#---------------------------------------------------
+# Profiling
+#---------------------------------------------------
+# Wall time, visited objects and optional cProfile capture of operator runs
+
+PROFILE_HISTORY_SIZE = 20
+PROFILE_STAT_LINES = 30
+
+
+@dataclasses.dataclass(slots=True)
+class OperatorProfile:
+    """One profiled operator run"""
+    operator: str
+    file: str
+    result: str
+    wall_time: float
+    visited: int = 0
+    checks: dict = dataclasses.field(default_factory=dict)
+    profile: str = ""
+
+
+# Newest first
+PROFILE_HISTORY = collections.deque(maxlen=PROFILE_HISTORY_SIZE)
+
+# Runs in progress (operators can call other profiled operators)
+ACTIVE_PROFILES = []
+
+# Only one cProfile can be enabled at a time, nested runs are part of the outermost capture
+CPROFILE_ACTIVE = False
+
+
+def profile_visit(count):
+    """Count objects visited by the running operator"""
+    if ACTIVE_PROFILES:
+        ACTIVE_PROFILES[-1].visited += count
+
+
+def profile_check_time(name, seconds):
+    if ACTIVE_PROFILES:
+        ACTIVE_PROFILES[-1].checks[name] = seconds
+
+
+def profiled(name):
+    """Decorator for Operator.execute, records an OperatorProfile per run"""
+    def decorator(execute):
+        @functools.wraps(execute)
+        def wrapper(self, context):
+            global CPROFILE_ACTIVE
+            run = OperatorProfile(name, bpy.data.filepath, "", 0.0)
+            profiler = None
+            if context.scene.other_properties.profile_cprofile and not CPROFILE_ACTIVE:
+                profiler = cProfile.Profile()
+
+            ACTIVE_PROFILES.append(run)
+            start = time.perf_counter()
+            try:
+                if profiler:
+                    try:
+                        profiler.enable()
+                        CPROFILE_ACTIVE = True
+                    except ValueError:
+                        # Another profiling tool is active (Python 3.12+)
+                        profiler = None
+                result = execute(self, context)
+            finally:
+                if profiler:
+                    profiler.disable()
+                    CPROFILE_ACTIVE = False
+                run.wall_time = time.perf_counter() - start
+                ACTIVE_PROFILES.pop()
+
+            run.result = ", ".join(sorted(result))
+            if profiler:
+                stream = io.StringIO()
+                pstats.Stats(profiler, stream=stream).sort_stats("cumulative").print_stats(PROFILE_STAT_LINES)
+                run.profile = stream.getvalue()
+
+            PROFILE_HISTORY.appendleft(run)
+            return result
+        return wrapper
+    return decorator
+
+
+def draw_profiles(layout):
+    """Last operator runs in the Checks panel"""
+    row = layout.row(align=True)
+    row.prop(bpy.context.scene.other_properties, "profile_cprofile", text="cProfile")
+    row.operator("wm.dump_check_profiles", text="", icon='EXPORT')
+    row.operator("wm.clear_check_profiles", text="", icon='TRASH')
+
+    if not PROFILE_HISTORY:
+        layout.label(text="No profiled runs")
+    for run in PROFILE_HISTORY:
+        layout.label(text=f"{run.operator}: {run.wall_time * 1000:.1f} ms, {run.visited} visited", icon='TIME')
+        for check, seconds in run.checks.items():
+            layout.label(text=f"    {check}: {seconds * 1000:.2f} ms")
+
+
+class DumpCheckProfilesOperator(bpy.types.Operator):
+    """Write profiled operator runs (with cProfile output) to a JSON file"""
+    bl_idname = "wm.dump_check_profiles"
+    bl_label = "Dump Check Profiles"
+
+    filepath: bpy.props.StringProperty(subtype='FILE_PATH')
+    filter_glob: bpy.props.StringProperty(default="*.json", options={'HIDDEN'})
+
+    @classmethod
+    def poll(cls, context):
+        return bool(PROFILE_HISTORY)
+
+    def invoke(self, context, event):
+        if not self.filepath:
+            blend_name = os.path.splitext(os.path.basename(bpy.data.filepath))[0] or "untitled"
+            self.filepath = blend_name + "_profiles.json"
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+    def execute(self, context):
+        with open(bpy.path.abspath(self.filepath), 'w') as profile_file:
+            json.dump([dataclasses.asdict(run) for run in PROFILE_HISTORY], profile_file, indent=2)
+        self.report({'INFO'}, f"{len(PROFILE_HISTORY)} profiles written to {self.filepath}")
+        return {'FINISHED'}
+
+
+class ClearCheckProfilesOperator(bpy.types.Operator):
+    """Clear profiled operator runs"""
+    bl_idname = "wm.clear_check_profiles"
+    bl_label = "Clear Check Profiles"
+
+    def execute(self, context):
+        PROFILE_HISTORY.clear()
+        return {'FINISHED'}
+
+
+def ProfilingRegister():
+    bpy.utils.register_class(DumpCheckProfilesOperator)
+    bpy.utils.register_class(ClearCheckProfilesOperator)
+
+def ProfilingUnregister():
+    bpy.utils.unregister_class(DumpCheckProfilesOperator)
+    bpy.utils.unregister_class(ClearCheckProfilesOperator)
+
+#---------------------------------------------------
+# /Profiling
+#---------------------------------------------------
+
+
+#---------------------------------------------------
+# Check Result Cache
+#---------------------------------------------------
+# Export check results reused while the checked scene state is unchanged
+
+class CheckResultCache:
+    """Results of the last check run, dirty after any depsgraph update or undo/redo"""
+
+    def __init__(self):
+        self.key = None
+        self.results = None
+        self.dirty = True
+
+    def get(self, key):
+        return self.results if not self.dirty and key == self.key else None
+
+    def store(self, key, results):
+        self.key = key
+        self.results = results
+        self.dirty = False
+
+    def clear(self):
+        self.__init__()
+
+
+CHECK_RESULT_CACHE = CheckResultCache()
+
+
+def check_cache_key(context, mode):
+    """Check inputs not seen by depsgraph updates: export mode, settings, rule file, view layer, selection
+    and (FINAL texture checks) the image files on disk"""
+    other_props = context.scene.other_properties
+    rule_set = get_rule_set()
+    image_files = ()
+    if mode == 'OP1':
+        image_files = tuple((image.name, image.filepath_raw, image.has_data, get_image_file_key(image))
+                            for image in bpy.data.images)
+    return (mode, other_props.custom_collider_name, other_props.texture_budget_mb, other_props.texture_max_size,
+            rule_set.path, rule_set.mtime, context.view_layer.name,
+            tuple(obj.as_pointer() for obj in context.selected_objects), image_files)
+
+
+@bpy.app.handlers.persistent
+def check_result_cache_invalidate(*args):
+    """Any data, transform or visibility change makes the cached results stale"""
+    CHECK_RESULT_CACHE.dirty = True
+
+
+@bpy.app.handlers.persistent
+def check_result_cache_clear(*args):
+    CHECK_RESULT_CACHE.clear()
+
+#---------------------------------------------------
+# /Check Result Cache
+#---------------------------------------------------
+
+
 #---------------------------------------------------
 # Export Check (Custom Window)
 #---------------------------------------------------
@@ -216,12 +987,24 @@ class ExportChecksWindowPanel(bpy.types.Panel):
 # Export Check (Custom Export)
 #---------------------------------------------------
 # Adds a custom Export FBX button and checks basic stuff (Root,Scale,Format)
+# Merge suggestions listed in the checks popup, the rest goes to the console
+MAX_MERGE_SUGGESTIONS = 5
+# Stray objects named in the ROOT entry
+MAX_ROOT_STRAYS = 5
+
 class ExportFBXWithChecks(bpy.types.Operator):
     """Custom FBX Export"""
     bl_idname = "export_scene.fbx_with_count"
     bl_label = "Export FBX with Count"
     
     
+    use_cache: bpy.props.BoolProperty(
+        name="Use Cached Results",
+        description="Reuse the last check results while the checked scene state is unchanged",
+        default=True
+    )
+    
+    @profiled("EXPORT CHECKS")
     def execute(self, context):
         
         # Check if not in design mode
@@ -234,46 +1017,103 @@ class ExportFBXWithChecks(bpy.types.Operator):
             self.open_fbx_export_window()
             return {'CANCELLED'}
         
+        # Nothing changed since the last run, reuse its results
+        start = time.perf_counter()
+        cache_key = check_cache_key(context, active_export_mode)
+        results = CHECK_RESULT_CACHE.get(cache_key) if self.use_cache else None
+        cached = results is not None
+        
+        if not cached:
+            results = self.run_checks(context, active_export_mode, check_mode_name)
+            if results is None:
+                return {'CANCELLED'}
+            CHECK_RESULT_CACHE.store(cache_key, results)
+        else:
+            self.report({'INFO'}, f"Scene unchanged, cached check results ({(time.perf_counter() - start) * 1000:.2f} ms)")
+        
+        check_messages, check_icons, reports, show_popup, check_report, timing_report = results
+        
+        global LAST_CHECK_REPORT
+        LAST_CHECK_REPORT = check_report
+        
+        for level, message in reports:
+            self.report(level, message)
+        
+        # Timings of the run that produced the results
+        self.report({'INFO'}, ("Cached, timings of the last run:\n" if cached else "") + timing_report)
+        
+        # SHOW CHECK POPUP
+        if show_popup:
+            self.show_popup(check_messages, check_icons,check_mode_name)
+        
+        # Run FBX export window
+        if not is_export_window_open():
+            self.open_fbx_export_window()
+        
+        return {'FINISHED'}
+    
+    def run_checks(self, context, active_export_mode, check_mode_name):
+        """Run all checks, returns (popup messages, popup icons, reports, show popup, check report, timing report),
+        None on error"""
+        
         # messages for popup
         check_messages= []
         check_icons= []
         
+        # (level, message) reported after the checks, replayed from the cache
+        reports = []
+        
         # for scale check
-        select_bool = False
+        select_bool = len(context.selected_objects) > 1
         export_bool = True    
         
+        # One scene traversal shared by all checks
+        index = SceneIndex(context, active_export_mode)
+        
+        # Structured results for the report export
+        check_report = CheckReport("EXPORT", check_mode_name, bpy.data.filepath)
+        
+        def add_result(name, passed, offenders=(), severity='ERROR', message=""):
+            check_report.add(name, passed, offenders, severity, message, index.check_times.get(name, 0.0))
+        
         #-------Run All Checks----------
         
         
         #--------------ROOT CHECK-----------------------------   
-        if object_root_check():
+        root_report = index.run_check("ROOT", root_check_report, index)
+        add_result("ROOT", root_report["passed"], root_report["strays"],
+                   message="" if root_report["transform_ok"] else f"{root_report['root']} not at origin")
+        if root_report["passed"]:
             check_messages.append("ROOT")
             check_icons.append('CHECKMARK')
         else:
             check_messages.append("ROOT")
             check_icons.append('CANCEL')
-            self.report({'ERROR'}, check_mode_name+ f" -ROOT ERROR!!!")
+            if root_report["strays"]:
+                # Name the culprits
+                strays = root_report["strays"]
+                check_messages.append(f"ROOT: {len(strays)} outside {root_report['root']}: " + ", ".join(strays[:MAX_ROOT_STRAYS])
+                                      + (" ..." if len(strays) > MAX_ROOT_STRAYS else ""))
+                check_icons.append('CANCEL')
+                print(f"Objects outside root {root_report['root']}: " + ", ".join(strays))
+            if not root_report["transform_ok"]:
+                check_messages.append(f"ROOT: {root_report['root']} not at origin")
+                check_icons.append('CANCEL')
+            reports.append(({'ERROR'}, check_mode_name+ f" -ROOT ERROR!!!"))
             
             
         # Get objects to check
-        objects_to_check = []
-        
-        if len(context.selected_objects) > 1:
-            objects_to_check = context.selected_objects
-            select_bool = True
-        elif len(context.selected_objects) == 1:
-            objects_to_check = [context.selected_objects[0]]
-        else:
-            objects_to_check = [obj for obj in context.visible_objects if obj.type == 'MESH']
+        records_to_check = index.check_records
         
         
         #--------------MATERIALS CHECK-----------------------------   
-        invalid_materials = check_material_format(objects_to_check)
+        invalid_materials = index.run_check("MATERIALS", check_material_format, records_to_check, active_export_mode)
+        add_result("MATERIALS", not invalid_materials, sorted(invalid_materials))
         
         if invalid_materials:
             check_messages.append("MATERIALS")
             check_icons.append('CANCEL')
-            self.report({'ERROR'}, check_mode_name+ f" -MATERIAL ERROR!!!")
+            reports.append(({'ERROR'}, check_mode_name+ f" -MATERIAL ERROR!!!"))
         else:
             check_messages.append("MATERIALS")
             check_icons.append('CHECKMARK')
@@ -282,23 +1122,26 @@ class ExportFBXWithChecks(bpy.types.Operator):
         
         #--------------SCALE CHECK-----------------------------   
             
-        objects, error = get_objects_recursive(export_bool, select_bool)
+        objects, error = index.run_check("SCALES", get_objects_recursive, export_bool, select_bool, index)
 
         if error:
             self.report({'ERROR'}, error)
-            return {'CANCELLED'}
+            return None
+        add_result("SCALES", not objects, objects)
 
         if objects:
             check_messages.append("SCALES")
             check_icons.append('CANCEL')
-            self.report({'ERROR'}, check_mode_name+ f" -SCALES ERROR!!!")
+            reports.append(({'ERROR'}, check_mode_name+ f" -SCALES ERROR!!!"))
         else:
             check_messages.append("SCALES")
             check_icons.append('CHECKMARK')
             
 
         #--------------COL CHECK-----------------------------        
-        if not check_has_col(objects_to_check):
+        has_col = index.run_check("COLLIDERS", check_has_col, records_to_check)
+        add_result("COLLIDERS", has_col, severity='WARNING', message="" if has_col else "No collider objects")
+        if not has_col:
             check_messages.append("COLLIDERS")
             check_icons.append('SEQUENCE_COLOR_02')
             
@@ -308,32 +1151,70 @@ class ExportFBXWithChecks(bpy.types.Operator):
         if active_export_mode == 'OP1':
             
             #--------------TEXTURE CHECK-----------------------------   
-            invalid_material_textures = check_albedo_texture_format(objects_to_check)
+            invalid_material_textures = index.run_check("TEXTURES", check_albedo_texture_format, records_to_check, active_export_mode)
+            add_result("TEXTURES", not invalid_material_textures, sorted(invalid_material_textures), 'WARNING')
             
             if invalid_material_textures:
                 check_messages.append("TEXTURES")
                 check_icons.append('SEQUENCE_COLOR_02')
             
+            #--------------TEXTURE MEMORY CHECK-----------------------------
+            other_props = context.scene.other_properties
+            texture_memory = index.run_check("TEXTURE MEMORY", check_texture_memory, records_to_check, other_props.texture_max_size)
+            print_texture_memory(texture_memory)
+
+            over_budget = texture_memory["total"] > other_props.texture_budget_mb * 1024 * 1024
+            add_result("TEXTURE MEMORY", not (over_budget or texture_memory["npot"] or texture_memory["oversized"]),
+                       sorted(set(texture_memory["npot"]) | set(texture_memory["oversized"])), 'WARNING',
+                       f"{format_megabytes(texture_memory['total'])} / {other_props.texture_budget_mb} MB")
+            check_messages.append(f"TEXTURE MEMORY: {format_megabytes(texture_memory['total'])} / {other_props.texture_budget_mb} MB")
+            check_icons.append('SEQUENCE_COLOR_02' if over_budget else 'CHECKMARK')
+            if texture_memory["npot"]:
+                check_messages.append(f"NOT POWER OF TWO: {len(texture_memory['npot'])} textures")
+                check_icons.append('SEQUENCE_COLOR_02')
+            if texture_memory["oversized"]:
+                check_messages.append(f"OVERSIZED: {len(texture_memory['oversized'])} textures")
+                check_icons.append('SEQUENCE_COLOR_02')
+
             #--------------_OLD CHECK-----------------------------
-            if search_for_old_objects(objects_to_check):
+            old_objects = index.run_check("_OLD", search_for_old_objects, records_to_check)
+            add_result("_OLD", not old_objects, [obj.name for obj in old_objects])
+            if old_objects:
                 check_messages.append("_OLD")
                 check_icons.append('CANCEL')
-                self.report({'ERROR'}, check_mode_name+ f" -_OLD ERROR!!!")
+                reports.append(({'ERROR'}, check_mode_name+ f" -_OLD ERROR!!!"))
             
-                
-        
-        
-        # SHOW CHECK POPUP
-        if not any('CANCEL' in icon for icon in check_icons):  
-            self.show_popup(check_messages, check_icons,check_mode_name)
-            self.report({'INFO'}, f"CHECKS OK")
-       
-        
-        # Run FBX export window
-        if not is_export_window_open():
-            self.open_fbx_export_window()
-        
-        return {'FINISHED'}
+        #--------------DRAW CALLS-----------------------------
+        draw_calls = index.run_check("DRAW CALLS", estimate_draw_calls, records_to_check)
+        add_result("DRAW CALLS", True, severity='INFO', message=f"{draw_calls['draw_calls']} ({draw_calls['instanced']} instanced)")
+        check_messages.append(f"DRAW CALLS: {draw_calls['draw_calls']} ({draw_calls['instanced']} instanced)")
+        check_icons.append('INFO')
+
+        material_merges = index.run_check("MERGES", suggest_material_merges, records_to_check)
+        add_result("MERGES", True, [f"{albedo}: {', '.join(mat_names)}" for albedo, mat_names in material_merges.items()],
+                   'INFO', f"{len(material_merges)} merge candidates")
+        for albedo, mat_names in list(material_merges.items())[:MAX_MERGE_SUGGESTIONS]:
+            check_messages.append(f"MERGE: {', '.join(mat_names)} ({albedo})")
+            check_icons.append('MATERIAL')
+        if len(material_merges) > MAX_MERGE_SUGGESTIONS:
+            check_messages.append(f"MERGE: {len(material_merges) - MAX_MERGE_SUGGESTIONS} more, see console")
+            check_icons.append('MATERIAL')
+        for albedo, mat_names in material_merges.items():
+            print(f"Merge candidates ({albedo}): {', '.join(mat_names)}")
+
+        # Timings
+        timing_report = index.timing_report()
+        print(timing_report)
+        
+        
+        # Popup when all passed, or to list root culprits
+        show_popup = not any('CANCEL' in icon for icon in check_icons)
+        if show_popup:
+            reports.append(({'INFO'}, f"CHECKS OK"))
+        elif not root_report["passed"]:
+            show_popup = True
+        
+        return tuple(check_messages), tuple(check_icons), tuple(reports), show_popup, check_report, timing_report
     
     # Get mode name for Check title
     def get_mode_for_title(self):
@@ -397,10 +1278,19 @@ def menu_func_export(self, context):
 
 def ExportWithChecksRegister():
     bpy.utils.register_class(ExportFBXWithChecks)
+    bpy.app.handlers.load_post.append(check_result_cache_clear)
+    for handlers in (bpy.app.handlers.depsgraph_update_post, bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        handlers.append(check_result_cache_invalidate)
     bpy.utils.register_class(ExportChecksWindowPanel)
     bpy.types.TOPBAR_MT_file_export.append(menu_func_export)
     
 def ExportWithChecksUnregister():
+    if check_result_cache_clear in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(check_result_cache_clear)
+    for handlers in (bpy.app.handlers.depsgraph_update_post, bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        if check_result_cache_invalidate in handlers:
+            handlers.remove(check_result_cache_invalidate)
+    CHECK_RESULT_CACHE.clear()
     bpy.utils.unregister_class(ExportFBXWithChecks)
     bpy.utils.unregister_class(ExportChecksWindowPanel)
     bpy.types.TOPBAR_MT_file_export.remove(menu_func_export)
@@ -418,14 +1308,19 @@ class CheckScalesOperator(ObjectModeOnlyOperator):
     bl_idname = "object.check_scales"
     bl_label = "Check Scales"
     
+    @profiled("SCALES")
     def execute(self, context):
         bpy.ops.object.select_all(action='DESELECT')
         collection_name = "Export"
-        objects, error = get_objects_recursive(False, False)
+        check_report = new_check_report("SCALES", context)
+        start = time.perf_counter()
+        objects = []
+        for obj in visible_scale_errors(context.view_layer):
+            objects.append(obj.name)
+            context.view_layer.objects.active = obj
+            obj.select_set(True)
 
-        if error:
-            self.report({'ERROR'}, error)
-            return {'CANCELLED'}
+        check_report.add("SCALES", not objects, objects, time=time.perf_counter() - start)
 
 
         if objects:
@@ -444,36 +1339,74 @@ class CheckScalesOperator(ObjectModeOnlyOperator):
         bpy.context.window_manager.popup_menu(draw, title="Check", icon=icon)
             
 
-def get_objects_recursive(export_bool, select_bool):
+def get_objects_recursive(export_bool, select_bool, index=None):
     """Returns a list of object names that don't have scale (1,1,1)"""
     objects_with_non_default_scales = []
-    checked_objects = set()
 
-    def check_object_scale(obj):
-        """Recursively check an object's scale and its children"""
-        if obj.name in checked_objects:
-            return
-        checked_objects.add(obj.name)
-
-        effective_scale = obj.matrix_world.to_scale()
-        if not (math.isclose(effective_scale.x, 1.0, rel_tol=1e-3) and
-                math.isclose(effective_scale.y, 1.0, rel_tol=1e-3) and
-                math.isclose(effective_scale.z, 1.0, rel_tol=1e-3)):
-            objects_with_non_default_scales.append(obj.name)
-            if not (export_bool):
-                bpy.context.view_layer.objects.active = obj
-                obj.select_set(True)
-                
-    if not select_bool:
-        for obj in bpy.context.view_layer.objects:
-            if obj.visible_get():  # Only check visible objects
-                check_object_scale(obj)
-    else:
-        for obj in bpy.context.selected_objects:
-            check_object_scale(obj)
+    if index is None:
+        index = SceneIndex(bpy.context)
+
+    records = index.selected_records if select_bool else index.visible_records
+
+    positions = np.fromiter((record.position for record in records), dtype=np.int64, count=len(records))
+
+    for i in np.flatnonzero(non_unit_scale_mask(index.scales[positions])):
+        record = records[i]
+        objects_with_non_default_scales.append(record.name)
+        if not (export_bool):
+            bpy.context.view_layer.objects.active = record.obj
+            record.obj.select_set(True)
 
     return objects_with_non_default_scales, None  # Return the list and no error
 
+
+def is_unit_scale(effective_scale):
+    """True if world scale is (1,1,1) within tolerance"""
+    return (math.isclose(effective_scale.x, 1.0, rel_tol=1e-3) and
+            math.isclose(effective_scale.y, 1.0, rel_tol=1e-3) and
+            math.isclose(effective_scale.z, 1.0, rel_tol=1e-3))
+
+
+def get_world_scales(objects):
+    """World scales (n, 3) of objects, read with foreach_get on collections"""
+    count = len(objects)
+    if hasattr(objects, "foreach_get"):
+        matrices = np.empty(count * 16, dtype=np.float32)
+        objects.foreach_get("matrix_world", matrices)
+    else:
+        # Python lists have no foreach_get, Matrix rows are transposed to columns
+        matrices = np.array([obj.matrix_world.transposed() for obj in objects], dtype=np.float32)
+
+    # Blender matrices are column-major, scale is the length of each basis column (as to_scale)
+    columns = matrices.reshape(count, 4, 4)[:, :3, :3].astype(np.float64)
+    return np.sqrt(np.einsum('nij,nij->ni', columns, columns))
+
+
+def non_unit_scale_mask(scales):
+    """Vectorized is_unit_scale, True where scale is not (1,1,1)"""
+    # Same as math.isclose(scale, 1.0, rel_tol=1e-3)
+    close = np.abs(scales - 1.0) <= 1e-3 * np.maximum(np.abs(scales), 1.0)
+    return ~np.all(close, axis=1)
+
+
+def scale_error_indices(objects):
+    """Indices of objects without (1,1,1) world scale (bulk path)"""
+    return np.flatnonzero(non_unit_scale_mask(get_world_scales(objects)))
+
+
+def visible_scale_errors(view_layer):
+    """Visible view layer objects without (1,1,1) world scale.
+    No SceneIndex: bulk scales first, visibility only for the offenders"""
+    layer_objects = view_layer.objects
+    profile_visit(len(layer_objects))
+    errors = [layer_objects[int(i)] for i in scale_error_indices(layer_objects)]
+    return [obj for obj in errors if obj.visible_get(view_layer=view_layer)]
+
+
+def scale_error_indices_per_object(objects):
+    """Indices of objects without (1,1,1) world scale (per-object path)"""
+    return [i for i, obj in enumerate(objects) if not is_unit_scale(obj.matrix_world.to_scale())]
+
                 
 def ChecksRegister():
     bpy.utils.register_class(CheckScalesOperator)
@@ -490,14 +1423,198 @@ def ChecksUnregister():
 #---------------------------------------------------
 
 
+#---------------------------------------------------
+# Live Checks
+#---------------------------------------------------
+# Incremental scale/material validation, updated from depsgraph_update_post
+
+class LiveCheckCache:
+    """Validation results keyed by object and material data-block pointer"""
+
+    def __init__(self):
+        self.valid = False
+        self.mode = None
+        self.pattern = None
+        self.rules = None             # (path, mtime) of the rule set the pattern came from
+        self.object_count = 0
+        self.links = {}               # object pointer -> (parent pointer, data pointer)
+        self.children = {}            # object pointer -> child objects
+        self.mesh_users = {}          # mesh pointer -> objects
+        self.scale_errors = {}        # object pointer -> name
+        self.object_materials = {}    # object pointer -> material pointers
+        self.material_users = {}      # material pointer -> user count
+        self.material_errors = {}     # material pointer -> name
+
+    def rebuild(self, context):
+        """Full validation of visible objects"""
+        self.__init__()
+        self.mode = context.scene.other_properties.export_mode_enum
+        rule_set = get_rule_set()
+        self.rules = (rule_set.path, rule_set.mtime)
+        self.pattern = rule_set.get_pattern("MATERIAL", self.mode)
+
+        view_layer = context.view_layer
+        self.object_count = len(view_layer.objects)
+        for obj in view_layer.objects:
+            self.links[obj.as_pointer()] = self.get_links(obj)
+            parent = obj.parent
+            if parent is not None:
+                self.children.setdefault(parent.as_pointer(), []).append(obj)
+            if obj.type == 'MESH':
+                self.mesh_users.setdefault(obj.data.as_pointer(), []).append(obj)
+            self.update_object(obj, view_layer)
+        self.valid = True
+
+    @staticmethod
+    def get_links(obj):
+        parent, data = obj.parent, obj.data
+        return (parent.as_pointer() if parent else None, data.as_pointer() if data else None)
+
+    def rules_changed(self):
+        """Rule file setting or file changed since the rebuild"""
+        rule_set = get_rule_set()
+        return (rule_set.path, rule_set.mtime) != self.rules
+
+    def is_stale(self, obj):
+        """Object unknown to the cache, re-parented or given other data since the rebuild"""
+        return self.links.get(obj.as_pointer()) != self.get_links(obj)
+
+    def update_hierarchy(self, obj, view_layer):
+        """Object and all its children (world scale follows the parent)"""
+        stack = [obj]
+        while stack:
+            current = stack.pop()
+            self.update_object(current, view_layer)
+            stack.extend(self.children.get(current.as_pointer(), ()))
+
+    def update_object(self, obj, view_layer):
+        pointer = obj.as_pointer()
+        visible = obj.name in view_layer.objects and obj.visible_get(view_layer=view_layer)
+
+        # Scale
+        if visible and not is_unit_scale(obj.matrix_world.to_scale()):
+            self.scale_errors[pointer] = obj.name
+        else:
+            self.scale_errors.pop(pointer, None)
+
+        # Materials used by visible meshes
+        for mat_pointer in self.object_materials.pop(pointer, ()):
+            self.material_users[mat_pointer] -= 1
+
+        if visible and obj.type == 'MESH':
+            materials = [slot.material for slot in obj.material_slots if slot.material]
+            self.object_materials[pointer] = tuple(mat.as_pointer() for mat in materials)
+            for mat in materials:
+                mat_pointer = mat.as_pointer()
+                if mat_pointer not in self.material_users:
+                    self.material_users[mat_pointer] = 0
+                    self.update_material(mat)
+                self.material_users[mat_pointer] += 1
+
+    def update_material(self, mat):
+        if self.pattern.match(mat.name):
+            self.material_errors.pop(mat.as_pointer(), None)
+        else:
+            self.material_errors[mat.as_pointer()] = mat.name
+
+    def scale_counts(self):
+        """(failed, checked) objects"""
+        return len(self.scale_errors), self.object_count
+
+    def material_counts(self):
+        """(failed, checked) materials used by visible meshes"""
+        used = [pointer for pointer, users in self.material_users.items() if users > 0]
+        failed = sum(1 for pointer in self.material_errors if self.material_users.get(pointer, 0) > 0)
+        return failed, len(used)
+
+
+LIVE_CHECK_CACHE = LiveCheckCache()
+
+
+@bpy.app.handlers.persistent
+def live_checks_depsgraph_update(scene, depsgraph):
+    """Re-validate only the IDs reported as updated"""
+    if not scene.other_properties.live_checks or not LIVE_CHECK_CACHE.valid:
+        return
+
+    view_layer = depsgraph.view_layer
+
+    # Object count, mode or rules changed -> rebuild on next draw
+    if (len(view_layer.objects) != LIVE_CHECK_CACHE.object_count or
+            scene.other_properties.export_mode_enum != LIVE_CHECK_CACHE.mode or
+            LIVE_CHECK_CACHE.rules_changed()):
+        LIVE_CHECK_CACHE.valid = False
+        return
+
+    updates = depsgraph.updates
+
+    # Objects added/removed (also both in one update, same count) or re-parented -> rebuild on next draw
+    for update in updates:
+        id_data = update.id.original
+        if isinstance(id_data, bpy.types.Collection) or (
+                isinstance(id_data, bpy.types.Object) and LIVE_CHECK_CACHE.is_stale(id_data)):
+            LIVE_CHECK_CACHE.valid = False
+            return
+
+    for update in updates:
+        id_data = update.id.original
+
+        if isinstance(id_data, bpy.types.Object):
+            if update.is_updated_transform:
+                LIVE_CHECK_CACHE.update_hierarchy(id_data, view_layer)
+            else:
+                LIVE_CHECK_CACHE.update_object(id_data, view_layer)
+
+        elif isinstance(id_data, bpy.types.Mesh):
+            # Material slots of mesh data
+            for obj in LIVE_CHECK_CACHE.mesh_users.get(id_data.as_pointer(), ()):
+                LIVE_CHECK_CACHE.update_object(obj, view_layer)
+
+        elif isinstance(id_data, bpy.types.Material):
+            if id_data.as_pointer() in LIVE_CHECK_CACHE.material_users:
+                LIVE_CHECK_CACHE.update_material(id_data)
+
+
+@bpy.app.handlers.persistent
+def live_checks_load_post(*args):
+    LIVE_CHECK_CACHE.valid = False
+
+
+def draw_live_checks(layout, context):
+    """Pass/fail counts of the live check cache"""
+    if not LIVE_CHECK_CACHE.valid or LIVE_CHECK_CACHE.rules_changed():
+        LIVE_CHECK_CACHE.rebuild(context)
+
+    for label, (failed, checked) in (("Scales", LIVE_CHECK_CACHE.scale_counts()),
+                                     ("Materials", LIVE_CHECK_CACHE.material_counts())):
+        layout.label(text=f"{label}: {checked - failed}/{checked} OK",
+                     icon='CHECKMARK' if failed == 0 else 'ERROR')
+
+
+def LiveChecksRegister():
+    bpy.app.handlers.depsgraph_update_post.append(live_checks_depsgraph_update)
+    bpy.app.handlers.load_post.append(live_checks_load_post)
+
+def LiveChecksUnregister():
+    if live_checks_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(live_checks_depsgraph_update)
+    if live_checks_load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(live_checks_load_post)
+    LIVE_CHECK_CACHE.valid = False
+
+#---------------------------------------------------
+# /Live Checks
+#---------------------------------------------------
+
+
 
 #---------------------------------------------------
 # COL Check
 #---------------------------------------------------
 # only for export check
 
-def check_has_col(objects_to_check):
-    has_col = any("COL" in obj.name for obj in objects_to_check)
+def check_has_col(records_to_check):
+    has_col = any(record.is_col for record in records_to_check)
     
     return has_col
 
@@ -512,61 +1629,282 @@ def check_has_col(objects_to_check):
 #---------------------------------------------------
 
 # Mark invalid if contains PROTOTYPE in final mode or doesn not follow naming conventions
-def check_material_format(objects_to_check):
+def check_material_format(records_to_check, active_export_mode):
     
-    # Get mode options
-    active_export_mode = bpy.context.scene.other_properties.export_mode_enum
-
+    material_names = [name for record in records_to_check for name in record.materials]
     
-    invalid_materials = set()
-    
-    # Get mode
-    if active_export_mode == 'OP1':
-            pattern = re.compile(r'^(?!.*_PROTOTYPE)[A-Z]+_[^_]+_[^_]+$')      
-    else:
-        pattern = re.compile(r'^(?:[A-Z][^_]*_PROTOTYPE|(?!.*PROTOTYPE)[A-Z]+_[^_]+_[^_]+)$')
-    
-    for obj in objects_to_check:
-        if obj.material_slots:
-            for slot in obj.material_slots:
-                if slot.material:
-                    name = slot.material.name
-                    if not pattern.match(name) or "COL" in name:
-                        invalid_materials.add(name)
+    invalid_materials = validate_names("MATERIAL", material_names, active_export_mode)
     
     return invalid_materials
 
 # If the texture's basename does not match the material name, mark it as invalid.
-def check_albedo_texture_format(objects_to_check):
-    
-    # Get mode options
-    active_export_mode = bpy.context.scene.other_properties.export_mode_enum
+def check_albedo_texture_format(records_to_check, active_export_mode):
     
     invalid_materials = set()
     
-    for obj in objects_to_check:
-        if not obj.data or not hasattr(obj.data, "materials"):
+    for record in records_to_check:
+        for mat_name, texture_name in record.images:
+            # Remove the file extension
+            texture_basename, _ = os.path.splitext(texture_name)
+            
+            expected_name = mat_name
+            
+            if active_export_mode == 'OP1':
+                expected_name = mat_name + "_A"
+                
+            if texture_basename != expected_name:
+                invalid_materials.add(mat_name)
+
+    return invalid_materials
+
+
+def get_albedo_image(mat_name, image_names):
+    """Albedo image of a material: _A suffix, then the material's own name, then the first image"""
+    basenames = [(os.path.splitext(image_name)[0], image_name) for image_name in image_names]
+    for basename, image_name in basenames:
+        if basename.endswith("_A"):
+            return image_name
+    for basename, image_name in basenames:
+        if basename == mat_name:
+            return image_name
+    return image_names[0] if image_names else None
+
+
+def estimate_draw_calls(records_to_check):
+    """Draw calls of the export: object x material slot
+
+    Colliders are not rendered and only LOD0 of a chain is drawn at once.
+    'instanced' counts each mesh and material pair once, for engines that
+    batch shared meshes.
+    """
+    draw_calls = 0
+    batches = set()
+    objects = 0
+
+    for record in records_to_check:
+        if record.type != 'MESH' or record.is_col or record.is_old or (record.lod_level or 0) > 0:
             continue
+        materials = record.materials or (None,)
+        objects += 1
+        draw_calls += len(materials)
+        batches.update((record.obj.data.name, mat_name) for mat_name in materials)
 
-        for mat in obj.data.materials:
-            if not mat or not mat.node_tree:
-                continue
+    return {"objects": objects, "draw_calls": draw_calls, "instanced": len(batches)}
 
-            for node in mat.node_tree.nodes:
-                if node.type == 'TEX_IMAGE' and node.image:
-                    texture_name = node.image.name
-                    # Remove the file extension
-                    texture_basename, _ = os.path.splitext(texture_name)
-                    
-                    mat_name = mat.name
-                    
-                    if active_export_mode == 'OP1':
-                        mat_name = mat.name + "_A"
-                        
-                    if texture_basename != mat_name:
-                        invalid_materials.add(mat.name)
 
-    return invalid_materials
+def suggest_material_merges(records_to_check):
+    """Materials sharing one albedo image -> {image name: [material names]}"""
+    material_images = {}
+    for record in records_to_check:
+        if record.is_col:
+            continue
+        for mat_name, image_name in record.images:
+            material_images.setdefault(mat_name, []).append(image_name)
+
+    albedo_materials = {}
+    for mat_name, image_names in material_images.items():
+        albedo = get_albedo_image(mat_name, image_names)
+        if albedo:
+            albedo_materials.setdefault(albedo, []).append(mat_name)
+
+    return {albedo: sorted(mat_names) for albedo, mat_names in sorted(albedo_materials.items()) if len(mat_names) > 1}
+
+
+#---------------Texture Memory--------------------
+
+# GPU bytes per pixel by texture suffix (guidelines.txt), block-compressed in engine:
+# _A albedo -> BC1 without alpha / BC3 with alpha, _S packed RGBA -> BC3
+TEXTURE_SUFFIX_BYTES = {
+    "_A": {3: 0.5, 4: 1.0},
+    "_S": {3: 1.0, 4: 1.0},
+}
+# Everything else uncompressed, RGB padded to RGBA
+UNCOMPRESSED_BYTES = {1: 1.0, 2: 2.0, 3: 4.0, 4: 4.0}
+MIP_CHAIN_FACTOR = 4.0 / 3.0
+
+# (absolute path, mtime, size) -> (width, height, channels)
+IMAGE_HEADER_CACHE = {}
+
+JPEG_SOF_MARKERS = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+
+
+def read_image_header(stream, extension=""):
+    """(width, height, channels) from a PNG, JPEG or TGA header without reading pixels, None if unknown"""
+    header = stream.read(32)
+
+    # PNG: IHDR is always the first chunk
+    if header[:8] == b"\x89PNG\r\n\x1a\n" and len(header) >= 26:
+        width, height = struct.unpack(">II", header[16:24])
+        channels = {0: 1, 2: 3, 3: 3, 4: 2, 6: 4}.get(header[25], 4)
+        return width, height, channels
+
+    # JPEG: walk the segments up to the frame header
+    if header[:2] == b"\xff\xd8":
+        stream.seek(2)
+        while True:
+            marker = stream.read(4)
+            if len(marker) < 4 or marker[0] != 0xFF:
+                return None
+            length = struct.unpack(">H", marker[2:4])[0]
+            if marker[1] in JPEG_SOF_MARKERS:
+                frame = stream.read(6)
+                if len(frame) < 6:
+                    return None
+                height, width = struct.unpack(">HH", frame[1:5])
+                return width, height, frame[5]
+            stream.seek(length - 2, io.SEEK_CUR)
+
+    # TGA has no signature, trust the extension
+    if extension.lower() == ".tga" and len(header) >= 18 and header[2] in {1, 2, 3, 9, 10, 11}:
+        width, height = struct.unpack("<HH", header[12:16])
+        if header[2] in {3, 11}:
+            return width, height, 1
+        if header[2] in {1, 9}:
+            return width, height, 3
+        return width, height, max(1, header[16] // 8)
+
+    return None
+
+
+def get_image_info(image):
+    """(width, height, channels) of an image without loading its pixels, None if unknown"""
+    # Already loaded, no read needed
+    if image.has_data:
+        width, height = image.size
+        return width, height, image.channels
+
+    extension = os.path.splitext(image.filepath_raw or image.name)[1]
+
+    if image.packed_file:
+        return read_image_header(io.BytesIO(image.packed_file.data), extension)
+
+    key = get_image_file_key(image)
+    if key is None:
+        return None
+
+    info = IMAGE_HEADER_CACHE.get(key)
+    if info is None:
+        with open(key[0], 'rb') as image_file:
+            info = read_image_header(image_file, extension)
+        IMAGE_HEADER_CACHE[key] = info
+    return info
+
+
+def get_image_file_key(image):
+    """(absolute path, mtime, size) of an unpacked file image, None if it has no readable file"""
+    if image.packed_file or image.source != 'FILE' or not image.filepath_raw:
+        return None
+
+    filepath = bpy.path.abspath(image.filepath_raw, library=image.library)
+    try:
+        stat = os.stat(filepath)
+    except OSError:
+        return None
+    return filepath, stat.st_mtime_ns, stat.st_size
+
+
+def is_power_of_two(value):
+    return value > 0 and value & (value - 1) == 0
+
+
+def estimate_texture_bytes(image_name, width, height, channels):
+    """Estimated GPU memory of a texture with its mip chain"""
+    basename = os.path.splitext(image_name)[0]
+    bytes_per_pixel = None
+    for suffix, suffix_bytes in TEXTURE_SUFFIX_BYTES.items():
+        if basename.endswith(suffix):
+            bytes_per_pixel = suffix_bytes.get(channels)
+            break
+    if bytes_per_pixel is None:
+        bytes_per_pixel = UNCOMPRESSED_BYTES.get(channels, 4.0)
+    return int(width * height * bytes_per_pixel * MIP_CHAIN_FACTOR)
+
+
+def check_texture_memory(records_to_check, max_size):
+    """GPU memory of images used by the export, flags non-power-of-two and oversized images
+
+    Returns {"total", "materials": {material: bytes}, "images": {image: (w, h, c, bytes)},
+    "npot", "oversized", "unknown"}.
+    """
+    images = {}
+    materials = {}
+    unknown = []
+
+    for record in records_to_check:
+        if record.is_col:
+            continue
+        for mat_name, image_name in record.images:
+            if image_name not in images and image_name not in unknown:
+                image = bpy.data.images.get(image_name)
+                info = get_image_info(image) if image else None
+                if info is None:
+                    unknown.append(image_name)
+                    continue
+                images[image_name] = info + (estimate_texture_bytes(image_name, *info),)
+            if image_name in images:
+                material_images = materials.setdefault(mat_name, set())
+                material_images.add(image_name)
+
+    return {
+        "total": sum(info[3] for info in images.values()),
+        "materials": {mat_name: sum(images[image_name][3] for image_name in image_names)
+                      for mat_name, image_names in sorted(materials.items())},
+        "images": images,
+        "npot": sorted(name for name, info in images.items() if not (is_power_of_two(info[0]) and is_power_of_two(info[1]))),
+        "oversized": sorted(name for name, info in images.items() if max(info[0], info[1]) > max_size),
+        "unknown": sorted(unknown),
+    }
+
+
+def format_megabytes(size):
+    return f"{size / (1024 * 1024):.1f} MB"
+
+
+def print_texture_memory(texture_memory):
+    print("Texture memory: " + format_megabytes(texture_memory["total"]))
+    for mat_name, size in texture_memory["materials"].items():
+        print(f"  {mat_name}: {format_megabytes(size)}")
+    for name in texture_memory["npot"]:
+        print(f"  Not power of two: {name}")
+    for name in texture_memory["oversized"]:
+        print(f"  Oversized: {name}")
+    for name in texture_memory["unknown"]:
+        print(f"  Unknown size: {name}")
+
+
+class TextureMemoryCheck(ObjectModeOnlyOperator):
+    """Estimate GPU memory of textures used by visible or selected objects"""
+    bl_idname = "wm.texture_memory_check"
+    bl_label = "Check Texture Memory"
+
+    @profiled("TEXTURE MEMORY")
+    def execute(self, context):
+        index = SceneIndex(context)
+        other_props = context.scene.other_properties
+
+        texture_memory = index.run_check("TEXTURE MEMORY", check_texture_memory, index.check_records, other_props.texture_max_size)
+        print_texture_memory(texture_memory)
+
+        over_budget = texture_memory["total"] > other_props.texture_budget_mb * 1024 * 1024
+        message = f"TEXTURE MEMORY: {format_megabytes(texture_memory['total'])} / {other_props.texture_budget_mb} MB"
+        new_check_report("TEXTURE MEMORY", context).add(
+            "TEXTURE MEMORY", not (over_budget or texture_memory["npot"] or texture_memory["oversized"]),
+            sorted(set(texture_memory["npot"]) | set(texture_memory["oversized"])), 'WARNING', message,
+            index.check_times["TEXTURE MEMORY"])
+
+        if over_budget or texture_memory["npot"] or texture_memory["oversized"]:
+            self.report({'WARNING'}, message)
+            self.show_popup(message + ". SEE CONSOLE", icon='ERROR')
+        else:
+            self.report({'INFO'}, message)
+            self.show_popup(message, icon='CHECKMARK')
+
+        return {'FINISHED'}
+
+    def show_popup(self, message, icon='INFO'):
+        def draw(self, context):
+            self.layout.label(text=message)
+        bpy.context.window_manager.popup_menu(draw, title="Texture Memory", icon=icon)
 
 
 class FormatCheck(ObjectModeOnlyOperator):
@@ -574,19 +1912,13 @@ class FormatCheck(ObjectModeOnlyOperator):
     bl_idname = "wm.format_check"
     bl_label = "Check Material Format"
 
+    @profiled("MATERIALS")
     def execute(self, context):
-        objects_to_check = []
+        index = SceneIndex(context)
         
-        
-        
-        if len(context.selected_objects) > 1:
-            objects_to_check = context.selected_objects
-        elif len(context.selected_objects) == 1:
-            objects_to_check = [context.selected_objects[0]]
-        else:
-            objects_to_check = [obj for obj in context.visible_objects if obj.type == 'MESH']
-        
-        invalid_materials = check_material_format(objects_to_check)
+        invalid_materials = index.run_check("MATERIALS", check_material_format, index.check_records, index.mode)
+        new_check_report("MATERIALS", context).add("MATERIALS", not invalid_materials, sorted(invalid_materials),
+                                                   time=index.check_times["MATERIALS"])
         
         
         
@@ -610,17 +1942,13 @@ class TextureFormatCheck(ObjectModeOnlyOperator):
     bl_idname = "wm.texture_format_check"
     bl_label = "Check Materials Texture Format"
 
+    @profiled("TEXTURES")
     def execute(self, context):
-        objects_to_check = []      
-        
-        if len(context.selected_objects) > 1:
-            objects_to_check = context.selected_objects
-        elif len(context.selected_objects) == 1:
-            objects_to_check = [context.selected_objects[0]]
-        else:
-            objects_to_check = [obj for obj in context.visible_objects if obj.type == 'MESH']
+        index = SceneIndex(context)
         
-        invalid_materials = check_albedo_texture_format(objects_to_check)
+        invalid_materials = index.run_check("TEXTURES", check_albedo_texture_format, index.check_records, index.mode)
+        new_check_report("TEXTURES", context).add("TEXTURES", not invalid_materials, sorted(invalid_materials), 'WARNING',
+                                                  time=index.check_times["TEXTURES"])
         
         
         
@@ -642,11 +1970,13 @@ class TextureFormatCheck(ObjectModeOnlyOperator):
 def FormatCheckRegister():
     bpy.utils.register_class(FormatCheck)
     bpy.utils.register_class(TextureFormatCheck)
+    bpy.utils.register_class(TextureMemoryCheck)
 
 
 def FormatCheckUnregister():
     bpy.utils.unregister_class(FormatCheck)
     bpy.utils.unregister_class(TextureFormatCheck)
+    bpy.utils.unregister_class(TextureMemoryCheck)
 
 
 #---------------------------------------------------
@@ -708,58 +2038,77 @@ class OtherProperties(bpy.types.PropertyGroup):
         description = "Collider material name",
         default = "COL_DEFAULT"
     )
-    show_collapse: bpy.props.BoolProperty(
-        name="Show Options",
+    show_collapse: bpy.props.BoolProperty(
+        name="Show Options",
+        default=False
+    )
+    live_checks: bpy.props.BoolProperty(
+        name="Live Checks",
+        description="Keep scale and material checks updated while editing",
+        default=False
+    )
+    rules_file: bpy.props.StringProperty(
+        name="Rules File",
+        description="Naming rules and guidelines (JSON), empty uses the bundled guidelines.json",
+        default="",
+        subtype='FILE_PATH'
+    )
+    show_profiling: bpy.props.BoolProperty(
+        name="Show Profiling",
+        default=False
+    )
+    profile_cprofile: bpy.props.BoolProperty(
+        name="cProfile",
+        description="Capture a cProfile of each profiled operator run (slower)",
         default=False
     )
+    texture_budget_mb: bpy.props.IntProperty(
+        name="Texture Budget",
+        description="GPU texture memory budget of one export in MB (FINAL mode)",
+        default=256,
+        min=1
+    )
+    texture_max_size: bpy.props.IntProperty(
+        name="Max Texture Size",
+        description="Largest allowed texture side in pixels",
+        default=2048,
+        min=1
+    )
 
-def object_root_check():
-    """Check if all selected or visible objects share the same top-level parent."""
-    
-    active_export_mode = bpy.context.scene.other_properties.export_mode_enum
-    
-    include_prototype_root = False
-    
-    if active_export_mode == 'OP2':
-        include_prototype_root = True
-    
-    def get_top_parent(obj):
-        """Recursively find the highest parent in the hierarchy."""
-        while obj.parent:
-            obj = obj.parent
-        return obj
-    
-    # Only if in PROTOTYPE mode
-    def make_extra_root_check(obj):
-        root_obj = obj
-        
-        if (root_obj.location == mathutils.Vector((0.0, 0.0, 0.0)) and
-            root_obj.rotation_euler == mathutils.Euler((0.0, 0.0, 0.0))):
-            return True
+def root_check_report(index):
+    """Roots of the selected or visible objects
 
-        return False
-    
-    # Determine which objects to check
-    selected_objects = bpy.context.selected_objects
-    objects_to_check = selected_objects if len(selected_objects) > 1 else [obj for obj in bpy.context.view_layer.objects if obj.visible_get()]
-    
-    if not objects_to_check:
-        return True  # No objects to check, assume valid
-    
-    # Get the top-most parent of the first object
-    top_parent = get_top_parent(objects_to_check[0])
+    Returns {"roots": {root name: object count}, "root": main root name,
+    "strays": objects outside the main root, "transform_ok", "passed"}.
+    The main root holds the most objects, the first object's root on ties.
+    """
+    records = index.root_records
 
-    # Ensure all other objects share the same top-level parent
-    for obj in objects_to_check:
-        if get_top_parent(obj) != top_parent:
-            return False  # Found an object with a different root parent
-    
-    # If PROTOTYPE mode is checked in panel, execute
-    if include_prototype_root:    
-        if not make_extra_root_check(top_parent):
-            return False
-    
-    return True  # All objects share the same top-level parent
+    if not records:
+        return {"roots": {}, "root": None, "strays": [], "transform_ok": True, "passed": True}
+
+    # Objects per root, in first-seen order
+    roots = {}
+    for record in records:
+        roots[record.root.name] = roots.get(record.root.name, 0) + 1
+
+    main_root = max(roots, key=roots.get)
+    strays = [record.name for record in records if record.root.name != main_root]
+
+    # PROTOTYPE mode: root must sit at the origin without rotation
+    transform_ok = True
+    if index.mode == 'OP2':
+        root_obj = next(record.root for record in records if record.root.name == main_root)
+        transform_ok = (root_obj.location == mathutils.Vector((0.0, 0.0, 0.0)) and
+                        root_obj.rotation_euler == mathutils.Euler((0.0, 0.0, 0.0)))
+
+    return {"roots": roots, "root": main_root, "strays": strays, "transform_ok": transform_ok,
+            "passed": not strays and transform_ok}
+
+
+def object_root_check(index):
+    """Check if all selected or visible objects share the same top-level parent."""
+    return root_check_report(index)["passed"]
 
 
 def RootCheckRegister():
@@ -871,7 +2220,10 @@ class AnimationsPanel(bpy.types.Panel):
         box = self.layout.box()
         box.label(text="MERGE ANIMATIONS")
         box.prop(context.scene, "target", text="Target")
-        box.prop(context.scene, "animations", text="Animations")
+        animationsRow = box.row()
+        animationsRow.enabled = not context.scene.merge_selected_animations
+        animationsRow.prop(context.scene, "animations", text="Animations")
+        box.prop(context.scene, "merge_selected_animations", text="Selected as Animations")
         box.operator("wm.merge_animations", text="Move Animations to Target")
         
 #---------------------------------------------------
@@ -882,7 +2234,6 @@ class AnimationsPanel(bpy.types.Panel):
 # MergeAnimations
 #---------------------------------------------------
 #Moves animation_data.action from Animations to Target with the same name, ignoring the .00x suffix. 
-#must import re
 
 
 class MergeAnimations(bpy.types.Operator):
@@ -896,73 +2247,138 @@ class MergeAnimations(bpy.types.Operator):
     bl_options = {'REGISTER', 'UNDO'}
 
 
+    @profiled("MERGE ANIMATIONS")
     def execute(self, context):
         targetsParent = context.scene.target
         animationsParent = context.scene.animations
+        merge_selected = context.scene.merge_selected_animations
 
-        isNone = False
         if targetsParent is None:
-            print("Target is None. ")
-            isNone = True
-        if animationsParent is None:
-            print("Animations is None. ")
-            isNone = True
-        if isNone:            
-            return {'FINISHED'}
-        
-        context.scene.animations = None
-
-        targets = [targetsParent]
-        stack = [targetsParent]
-        while stack:
-            current = stack.pop()
-            targets.append(current)
-            for child in current.children:
-                stack.append(child)
+            self.report({'ERROR'}, "Target is None")
+            return {'CANCELLED'}
 
-        animations = [animationsParent]
-        stack = [animationsParent]
-        while stack:
-            current = stack.pop()
-            animations.append(current)
-            for child in current.children:
-                stack.append(child)
+        children_map = build_children_map()
+        target_hierarchy = set(collect_hierarchy(targetsParent, children_map))
+        # Animation hierarchies holding the target would merge and delete it
+        target_ancestors = set(get_ancestors(targetsParent))
+
+        # Batch mode: every selected hierarchy outside the target is merged
+        if merge_selected:
+            selected = context.selected_objects
+            skipped = [obj.name for obj in selected if obj in target_ancestors]
+            if skipped:
+                self.report({'WARNING'}, "Skipped, parents of the target: " + ", ".join(skipped))
+            animation_roots = get_selected_roots([obj for obj in selected
+                                                  if obj not in target_hierarchy and obj not in target_ancestors])
+        else:
+            if animationsParent is not None and (animationsParent in target_hierarchy or animationsParent in target_ancestors):
+                self.report({'ERROR'}, f"Animations {animationsParent.name} contains or is part of the target")
+                return {'CANCELLED'}
+            animation_roots = [animationsParent] if animationsParent is not None else []
 
-        rex = r"\.\d+$"
-        for ani in animations:
-            if ani.animation_data is not None:
-                found = False
-
-                aniName = ani.name
-                if len(aniName) > 4:
-                    if re.match(rex, aniName[-4:]):
-                        aniName = aniName[:-4]
-
-                for tar in targets:
-                    tarName = tar.name
-                    if len(tarName) > 4:
-                        if re.match(rex, tarName[-4:]):
-                            tarName = tarName[:-4]
-
-                    if aniName == tarName:
-                        found = True
-                        tar.animation_data_create()
-                        tar.animation_data.action = ani.animation_data.action
-                        break
-                
-                if found:
-                    continue
-                else:
-                    print("Merge Animations: Object with animation \"" + aniName + "\" has no match in objects without animation. ")
+        if not animation_roots:
+            self.report({'ERROR'}, "Animations is None")
+            return {'CANCELLED'}
+        
+        context.scene.animations = None
 
+        merged_count, unmatched, animations = merge_animations(targetsParent, animation_roots, children_map)
 
         bpy.ops.object.select_all(action='DESELECT')
         for ani in animations:
             ani.select_set(True)
         bpy.ops.object.delete(use_global=False, confirm=False)
 
+        if unmatched:
+            self.report({'WARNING'}, f"{merged_count} animations merged, no match in target for:\n" +
+                        "\n".join(f"{item['hierarchy']}: {item['name']}" for item in unmatched))
+        else:
+            self.report({'INFO'}, f"{merged_count} animations merged")
+
         return {'FINISHED'}
 
+
+def build_children_map():
+    """Parent -> children of all objects in one pass (Object.children scans every object per call)"""
+    children_map = {}
+    for obj in bpy.data.objects:
+        if obj.parent is not None:
+            children_map.setdefault(obj.parent, []).append(obj)
+    return children_map
+
+
+def collect_hierarchy(root, children_map=None):
+    """Root and all its children"""
+    if children_map is None:
+        children_map = build_children_map()
+    objects = []
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        objects.append(current)
+        stack.extend(children_map.get(current, ()))
+    return objects
+
+
+def get_ancestors(obj):
+    """Parents of obj up to its root"""
+    ancestors = []
+    parent = obj.parent
+    while parent is not None:
+        ancestors.append(parent)
+        parent = parent.parent
+    return ancestors
+
+
+def get_selected_roots(selected):
+    """Selected objects without a selected parent"""
+    selected_set = set(selected)
+    roots = []
+    for obj in selected:
+        parent = obj.parent
+        while parent is not None and parent not in selected_set:
+            parent = parent.parent
+        if parent is None:
+            roots.append(obj)
+    return roots
+
+
+def merge_animations(target_root, animation_roots, children_map=None):
+    """Move actions from animation hierarchies to target objects with the same name (ignoring .00x).
+    Returns merged count, unmatched [{"hierarchy", "name"}] and all animation objects"""
+    if children_map is None:
+        children_map = build_children_map()
+
+    # Normalized name -> first target with that name
+    target_index = {}
+    for tar in collect_hierarchy(target_root, children_map):
+        target_index.setdefault(strip_duplicate_suffix(tar.name), tar)
+
+    merged_count = 0
+    unmatched = []
+    animations = []
+
+    for root in animation_roots:
+        hierarchy = collect_hierarchy(root, children_map)
+        animations.extend(hierarchy)
+        profile_visit(len(hierarchy))
+
+        for ani in hierarchy:
+            if ani.animation_data is None:
+                continue
+
+            aniName = strip_duplicate_suffix(ani.name)
+            tar = target_index.get(aniName)
+            if tar is None:
+                unmatched.append({"hierarchy": root.name, "name": aniName})
+                continue
+
+            tar.animation_data_create()
+            tar.animation_data.action = ani.animation_data.action
+            merged_count += 1
+
+    return merged_count, unmatched, animations
+
 #---------------------------------------------------
 # /MergeAnimations
 #---------------------------------------------------
@@ -983,103 +2399,107 @@ class MarkStaticAnimations(bpy.types.Operator):
     
     def execute(self, context):
         
-        # Amount of shift at frame 0
-        shift_amount = 0.00001
+        marked_count = 0
 
-        # Iterate over all selected objects in the scene
+        # Iterate over all selected objects in the scene, the marker is written either way
         for obj in context.selected_objects:
             if obj.animation_data and obj.animation_data.action:
-                static = True 
-                
-                for fcurve in obj.animation_data.action.fcurves:
-                    if fcurve.data_path not in {"location", "rotation_euler"}:
-                        continue
-
-                    key_val_at_zero = None
-                    key_val_at_one = None
-                    key_val_at_end = None
-                    key_val_at_endplus = None
-                    
-                    frames = sorted(kp.co.x for kp in fcurve.keyframe_points)
-
-                    if len(frames) >= 2:
-                        end_frame = frames[-1]     
-                        endplus_frame = frames[-2]
-                    else:
-                        end_frame = None
-                        endplus_frame = None
-
-                    for kp in fcurve.keyframe_points:
-                        frame = kp.co.x
-                        if abs(frame - 0) < 1e-4:
-                            key_val_at_zero = kp.co.y
-                            
-                        elif abs(frame - 1) < 1e-4:
-                            key_val_at_one = kp.co.y
-                            
-                        elif end_frame is not None and abs(frame - end_frame) < 1e-4:
-                            key_val_at_end = kp.co.y
-                            
-                        elif endplus_frame is not None and abs(frame - endplus_frame) < 1e-4:
-                            key_val_at_endplus = kp.co.y
-                            
-
-                    # If keyframe is missing or the values differ mark as non-static.
-                    if key_val_at_zero is None or key_val_at_one is None or key_val_at_end is None or key_val_at_endplus is None:
-                        
-                        static = False
-                        break
-                    
-                    if abs(key_val_at_zero - key_val_at_one) > 1e-4:
-                        
-                        static = False
-                        break
-                    
-                    if abs(key_val_at_end - key_val_at_endplus) > 1e-4:
-                        
-                        static = False
-                        break
-
-                # Mark static all valid by shifting (shift is based on orig keyframe locrots)
-                if static:
-                    # Get location & rotation at frame 1
-                    obj.location = obj.animation_data.action.fcurves[0].evaluate(1), \
-                                   obj.animation_data.action.fcurves[1].evaluate(1), \
-                                   obj.animation_data.action.fcurves[2].evaluate(1)
-
-                    obj.rotation_euler = obj.animation_data.action.fcurves[3].evaluate(1), \
-                                         obj.animation_data.action.fcurves[4].evaluate(1), \
-                                         obj.animation_data.action.fcurves[5].evaluate(1)
-
-                    # Apply shift
-                    obj.location = (obj.location[0] + shift_amount, obj.location[1] + shift_amount, obj.location[2] + shift_amount)
-                    obj.rotation_euler = (obj.rotation_euler[0] + shift_amount, obj.rotation_euler[1] + shift_amount, obj.rotation_euler[2] + shift_amount)
-
-                    # Insert modified keyframe at frame 0
-                    obj.keyframe_insert(data_path="location", frame=0)
-                    obj.keyframe_insert(data_path="rotation_euler", frame=0)
-
-                    # Get location & rotation at endplus_frame
-                    obj.location = obj.animation_data.action.fcurves[0].evaluate(endplus_frame), \
-                                   obj.animation_data.action.fcurves[1].evaluate(endplus_frame), \
-                                   obj.animation_data.action.fcurves[2].evaluate(endplus_frame)
-
-                    obj.rotation_euler = obj.animation_data.action.fcurves[3].evaluate(endplus_frame), \
-                                         obj.animation_data.action.fcurves[4].evaluate(endplus_frame), \
-                                         obj.animation_data.action.fcurves[5].evaluate(endplus_frame)
-
-                    # Apply shift
-                    obj.location = (obj.location[0] + shift_amount, obj.location[1] + shift_amount, obj.location[2] + shift_amount)
-                    obj.rotation_euler = (obj.rotation_euler[0] + shift_amount, obj.rotation_euler[1] + shift_amount, obj.rotation_euler[2] + shift_amount)
-
-                    # Insert modified keyframe at end_frame
-                    obj.keyframe_insert(data_path="location", frame=end_frame)
-                    obj.keyframe_insert(data_path="rotation_euler", frame=end_frame)
+                static = bool(mark_static_animation(obj.animation_data.action))
+                obj[STATIC_MARKER_PROPERTY] = static
+                marked_count += static
                   
-        self.report({'INFO'}, f"OBJECTS MARKED")
+        self.report({'INFO'}, f"{marked_count} OBJECTS MARKED")
                     
         return {'FINISHED'}
 
+
+# Amount of shift at frame 0 and end frame
+STATIC_SHIFT_AMOUNT = 0.00001
+STATIC_DATA_PATHS = {"location", "rotation_euler"}
+
+
+def read_keyframe_coords(fcurve):
+    """Keyframe (frame, value) pairs of an fcurve as (n, 2) array"""
+    count = len(fcurve.keyframe_points)
+    coords = np.empty(count * 2, dtype=np.float32)
+    fcurve.keyframe_points.foreach_get('co', coords)
+    return coords.reshape(count, 2)
+
+
+def find_static_keys(coords, tol=1e-4):
+    """Indices of keys at frame 0, 1, end and the one before end if the curve holds
+    the same value at start and end, else None"""
+    if len(coords) < 2:
+        return None
+
+    frames = coords[:, 0].astype(np.float64)
+    values = coords[:, 1].astype(np.float64)
+
+    sorted_frames = np.sort(frames)
+    end_frame = sorted_frames[-1]
+    endplus_frame = sorted_frames[-2]
+
+    # A key belongs to the first matching frame, last key wins (as the per-key loop did)
+    at_zero = np.abs(frames) < tol
+    at_one = ~at_zero & (np.abs(frames - 1) < tol)
+    at_end = ~at_zero & ~at_one & (np.abs(frames - end_frame) < tol)
+    at_endplus = ~at_zero & ~at_one & ~at_end & (np.abs(frames - endplus_frame) < tol)
+
+    keys = []
+    for mask in (at_zero, at_one, at_end, at_endplus):
+        hits = np.flatnonzero(mask)
+        # If keyframe is missing mark as non-static
+        if len(hits) == 0:
+            return None
+        keys.append(hits[-1])
+
+    zero, one, end, endplus = keys
+
+    # If the values differ mark as non-static
+    if abs(values[zero] - values[one]) > tol or abs(values[end] - values[endplus]) > tol:
+        return None
+
+    return zero, one, end, endplus
+
+
+def mark_static_animation(action, shift_amount=STATIC_SHIFT_AMOUNT):
+    """Shift location/rotation keys at frame 0 and end frame if the action is static, returns True if marked"""
+    fcurves = [fcurve for fcurve in action.fcurves if fcurve.data_path in STATIC_DATA_PATHS]
+    if not fcurves:
+        return False
+
+    analysed = []
+    for fcurve in fcurves:
+        coords = read_keyframe_coords(fcurve)
+        keys = find_static_keys(coords)
+        if keys is None:
+            return False
+        analysed.append((fcurve, coords, keys))
+
+    # Mark static all valid by shifting (shift is based on orig keyframe values)
+    for fcurve, coords, (zero, one, end, endplus) in analysed:
+        count = len(coords)
+        handles_left = np.empty(count * 2, dtype=np.float32)
+        handles_right = np.empty(count * 2, dtype=np.float32)
+        fcurve.keyframe_points.foreach_get('handle_left', handles_left)
+        fcurve.keyframe_points.foreach_get('handle_right', handles_right)
+        handles_left = handles_left.reshape(count, 2)
+        handles_right = handles_right.reshape(count, 2)
+
+        # Frame 0 gets value at frame 1, end frame gets value at endplus frame
+        for key, source in ((zero, one), (end, endplus)):
+            delta = coords[source, 1] + shift_amount - coords[key, 1]
+            coords[key, 1] += delta
+            handles_left[key, 1] += delta
+            handles_right[key, 1] += delta
+
+        fcurve.keyframe_points.foreach_set('co', coords.ravel())
+        fcurve.keyframe_points.foreach_set('handle_left', handles_left.ravel())
+        fcurve.keyframe_points.foreach_set('handle_right', handles_right.ravel())
+        fcurve.update()
+
+    return True
+
 class SelectStaticAnimations(bpy.types.Operator):
     """Select all animated objects marked as static"""
     bl_label = "Select Static"
@@ -1091,9 +2511,6 @@ class SelectStaticAnimations(bpy.types.Operator):
     
     def execute(self, context):
         
-        shift_amount = 0.00001
-        tol = 1e-7  # Tolerance for float
-        
         bpy.ops.object.select_all(action='DESELECT')
         
         for obj in context.scene.objects:
@@ -1103,59 +2520,50 @@ class SelectStaticAnimations(bpy.types.Operator):
             if not (obj.animation_data and obj.animation_data.action):
                 continue
             
-            action = obj.animation_data.action
-            valid = True
+            # Marked objects (static or not) are selected without analysing curves
+            valid = obj.get(STATIC_MARKER_PROPERTY)
             
-
-            for data_path in ("location", "rotation_euler"):
-                
-                for axis in range(3):
-                    fcurve = next((fc for fc in action.fcurves 
-                                   if fc.data_path == data_path and fc.array_index == axis), None)
-                    
-                    if fcurve is None:
-                        valid = False
-                        break
-                    
-                    # Get values at 0 and 1
-                    key_val_at_zero = None
-                    key_val_at_one = None
-                    
-                    for kp in fcurve.keyframe_points:
-                        
-                        if abs(kp.co.x - 0) < tol:
-                            key_val_at_zero = kp.co.y
-                            
-                        elif abs(kp.co.x - 1) < tol:
-                            key_val_at_one = kp.co.y
-                            
-                    if key_val_at_zero is None or key_val_at_one is None:
-                        valid = False
-                        break  
-                    
-                    # Calculate the difference
-                    diff = key_val_at_one - key_val_at_zero
-                    
-                    if(diff<0):
-                        diff = diff * -1
-                        
-                    if abs(diff - shift_amount) > tol:
-                        valid = False
-                        break
-                
-                if not valid:
-                    break
+            if valid is None:
+                # Objects marked before the property existed
+                valid = has_static_shift(obj.animation_data.action)
+                obj[STATIC_MARKER_PROPERTY] = valid
             
             # If all channels pass the check, select the object
-            if valid:
-                obj.select_set(True)
-            else:
-                obj.select_set(False)
+            obj.select_set(bool(valid))
         
         self.report({'INFO'}, f"STATIC OBJECTS SELECTED")
                 
         return {'FINISHED'}
 
+
+# Custom property persisted on objects by Mark Static (True static, False not static)
+STATIC_MARKER_PROPERTY = "bbg_static"
+
+
+def has_static_shift(action, shift_amount=STATIC_SHIFT_AMOUNT, tol=1e-7):
+    """True if every location/rotation channel has the frame 0/1 shift of MarkStaticAnimations"""
+    for data_path in ("location", "rotation_euler"):
+        for axis in range(3):
+            fcurve = action.fcurves.find(data_path, index=axis)
+            if fcurve is None:
+                return False
+
+            coords = read_keyframe_coords(fcurve).astype(np.float64)
+            frames = coords[:, 0]
+
+            # Get values at 0 and 1 (last key wins)
+            at_zero = np.flatnonzero(np.abs(frames) < tol)
+            at_one = np.flatnonzero((np.abs(frames) >= tol) & (np.abs(frames - 1) < tol))
+            if len(at_zero) == 0 or len(at_one) == 0:
+                return False
+
+            diff = abs(coords[at_one[-1], 1] - coords[at_zero[-1], 1])
+            if abs(diff - shift_amount) > tol:
+                return False
+
+    return True
+
+
 #---------------------------------------------------
 # /StaticAnimations
 #---------------------------------------------------
@@ -1174,6 +2582,11 @@ def MergeAnimationsRegister():
 
     bpy.types.Scene.target = bpy.props.PointerProperty(type=bpy.types.Object)
     bpy.types.Scene.animations = bpy.props.PointerProperty(type=bpy.types.Object)
+    bpy.types.Scene.merge_selected_animations = bpy.props.BoolProperty(
+        name="merge_selected_animations",
+        description="Merge every selected hierarchy into Target",
+        default=False
+    )
 
 def MergeAnimationsUnregister():
     bpy.utils.unregister_class(AnimationsPanel)
@@ -1183,6 +2596,7 @@ def MergeAnimationsUnregister():
 
     del bpy.types.Scene.target
     del bpy.types.Scene.animations
+    del bpy.types.Scene.merge_selected_animations
     
 #---------------------------------------------------
 # /ANI regiseter
@@ -1207,76 +2621,73 @@ class CleanMaterials(ObjectModeOnlyOperator):
     bl_options = {'REGISTER', 'UNDO'}
 
 
+    @profiled("CLEAN MATERIALS")
     def execute(self, context):
-        replaced_count = 0
-
         include_name_MATERIAL = context.scene.include_name_MATERIAL
         
         ColliderMaterial_name = bpy.context.scene.other_properties.custom_collider_name
-        
-        MATERIAL_name = "Material"
-        
-        allMaterials = {}
-        rex = r"\.\d+$"
-        cleanMaterials = []
-        dirtyMaterials = []
 
-        for obj in bpy.data.objects:
-            if obj.type == 'MESH':
-                for slot in obj.material_slots:
-                    if slot.material:
-                        if slot.material.name == ColliderMaterial_name:
-                            obj.data.materials.clear()
-                        else:
-                            if slot.material not in allMaterials:
-                                allMaterials[slot.material] = []
-                            allMaterials[slot.material].append(obj)
-
-        for mat, objects in allMaterials.items():
-            if len(mat.name) > 4:
-                if re.match(rex, mat.name[-4:]):
-                    if include_name_MATERIAL:
-                        dirtyMaterials.append(mat)
-                    else:
-                        if mat.name[:-4] == MATERIAL_name:
-                            cleanMaterials.append(mat)
-                        else:
-                            dirtyMaterials.append(mat)
-                else:
-                    cleanMaterials.append(mat)
-            else:
-                cleanMaterials.append(mat)
-
-        for dirtyMat in dirtyMaterials:
-            found = False
-            for cleanMat in cleanMaterials:
-                if dirtyMat.name[:-4] == cleanMat.name:
-                    found = True
-                    break
-            if not found:
-                dirtyMat.name = dirtyMat.name[:-4]
-                cleanMaterials.append(dirtyMat)
-                
-        for mat, objects in allMaterials.items():
-            if mat not in cleanMaterials:
-                for cleanMat in cleanMaterials:
-                    if mat.name[:-4] == cleanMat.name:
-                        for obj in objects:
-                            for slot in obj.material_slots:
-                                if slot.material == mat:
-                                    slot.material = cleanMat
-                        break
-
-        for mat in bpy.data.materials:
-            if mat not in cleanMaterials:
-                bpy.data.materials.remove(mat)
-                replaced_count += 1
+        replaced_count = clean_duplicate_materials(bpy.data.objects, ColliderMaterial_name, include_name_MATERIAL)
 
         self.report({'INFO'}, f"{replaced_count} Materials Replaced")
 
         return {'FINISHED'}
 
 
+def clean_duplicate_materials(objects, ColliderMaterial_name, include_name_MATERIAL):
+    """Remap .00x material duplicates to their base material, returns removed count"""
+    MATERIAL_name = "Material"
+    
+    allMaterials = {}
+    duplicate_rule = DUPLICATE_REGEX
+    mesh_objects = [obj for obj in objects if obj.type == 'MESH']
+    profile_visit(len(mesh_objects))
+
+    # Used materials (and clear collider materials)
+    for obj in mesh_objects:
+        for slot in obj.material_slots:
+            if slot.material:
+                if slot.material.name == ColliderMaterial_name:
+                    obj.data.materials.clear()
+                else:
+                    allMaterials.setdefault(slot.material, None)
+
+    # Clean materials by name, dirty materials with their base name
+    cleanMaterials = {}
+    dirtyMaterials = []
+
+    for mat in allMaterials:
+        match = duplicate_rule.match(mat.name)
+        if match and (include_name_MATERIAL or match.group(1) != MATERIAL_name):
+            dirtyMaterials.append((mat, match.group(1)))
+        else:
+            cleanMaterials[mat.name] = mat
+
+    # Dirty materials without a clean one become the clean one
+    remap = {}
+    for dirtyMat, base_name in dirtyMaterials:
+        cleanMat = cleanMaterials.get(base_name)
+        if cleanMat is None:
+            dirtyMat.name = base_name
+            cleanMaterials[dirtyMat.name] = dirtyMat
+        else:
+            remap[dirtyMat] = cleanMat
+
+    # Single slot remap pass
+    for obj in mesh_objects:
+        for slot in obj.material_slots:
+            cleanMat = remap.get(slot.material)
+            if cleanMat is not None:
+                slot.material = cleanMat
+
+    # Remove everything else in one batch
+    keep = set(cleanMaterials.values())
+    materials_to_remove = [mat for mat in bpy.data.materials if mat not in keep]
+    bpy.data.batch_remove(materials_to_remove)
+
+    return len(materials_to_remove)
+
+
 def CleanMaterialsRegister():
     bpy.utils.register_class(CleanMaterials)
 
@@ -1295,11 +2706,10 @@ def CleanMaterialsUnregister():
 #---------------------------------------------------
 # CleanTextures
 #---------------------------------------------------
-#On all objects, cleans materials with the same name. Remove Collider Tools material
-#must import re
+#Replaces .00x image duplicates with the base image in all node trees (materials, worlds, lights, node groups)
 
 class CleanTextures(ObjectModeOnlyOperator):
-    """Remove all material duplicates and COL materials in Scene"""
+    """Replace all texture duplicates in Scene"""
     bl_label = "Clean Textures"
     bl_idname = "wm.clean_textures"
     bl_space_type = 'VIEW_3D'
@@ -1309,41 +2719,174 @@ class CleanTextures(ObjectModeOnlyOperator):
     bl_options = {'REGISTER', 'UNDO'}
 
 
+    @profiled("CLEAN TEXTURES")
     def execute(self, context):
-        replaced_count = 0
+        if context.scene.clean_textures_by_content:
+            remap = build_image_remap_by_content()
+        else:
+            remap = build_image_remap_by_name()
+        
+        profile_visit(len(bpy.data.images))
 
-        for obj in bpy.data.objects:
-            if obj.type != 'MESH':
-                continue
-            
-            if obj.data.materials:
-                for mat in obj.data.materials:
-                    if mat and mat.node_tree:
-                        for node in mat.node_tree.nodes:
-                            if node.type == 'TEX_IMAGE' and node.image:
-                                image = node.image
-                                
-                                # Check if name has a suffix (.001, .002, etc.)
-                                match = re.match(r"(.+)\.\d{3}$", image.name)
-                                if match:
-                                    base_name = match.group(1)  # Extract base name
-
-                                    # Check if a texture with the base name exists
-                                    if base_name in bpy.data.images:
-                                        node.image = bpy.data.images[base_name]  # Replace texture
-                                        replaced_count += 1
-
-        self.report({'INFO'}, f"{replaced_count} Textures Replaced")
+        # Names are gone once the duplicates are removed
+        if remap:
+            print("Clean Textures removed:\n" + "\n".join(f"{image.name} -> {base.name}" for image, base in remap.items()))
+
+        replaced_count = remap_image_users(remap)
+
+        self.report({'INFO'}, f"{replaced_count} Textures Replaced, {len(remap)} Duplicate Images Removed")
 
         return {'FINISHED'}
 
 
+def build_image_remap_by_name():
+    """Duplicate image (.00x) -> existing image with the base name"""
+    duplicate_rule = DUPLICATE_REGEX
+    images_by_name = {image.name: image for image in bpy.data.images}
+
+    remap = {}
+    for image in images_by_name.values():
+        # Check if name has a suffix (.001, .002, etc.)
+        match = duplicate_rule.match(image.name)
+        if match:
+            base_image = images_by_name.get(match.group(1))
+            if base_image is not None:
+                remap[image] = base_image
+    return remap
+
+
+#---------------Content hash mode--------------------
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def hash_file(path):
+    """Content hash of a file, read in chunks"""
+    digest = hashlib.blake2b(digest_size=20)
+    with open(path, 'rb') as image_file:
+        for chunk in iter(lambda: image_file.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def hash_bytes(data):
+    """Content hash of packed bytes, fed in chunks without copying"""
+    digest = hashlib.blake2b(digest_size=20)
+    view = memoryview(data)
+    for start in range(0, len(view), HASH_CHUNK_SIZE):
+        digest.update(view[start:start + HASH_CHUNK_SIZE])
+    return digest.hexdigest()
+
+
+class ImageHashCache:
+    """File content hashes keyed by filepath + mtime + size, stored in a JSON sidecar"""
+
+    def __init__(self, path):
+        self.path = path
+        self.entries = {}
+        self.changed = False
+        try:
+            with open(path, 'r') as cache_file:
+                self.entries = json.load(cache_file)
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def get_hash(self, filepath):
+        stat = os.stat(filepath)
+        entry = self.entries.get(filepath)
+        if entry and entry["mtime"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+            return entry["hash"]
+
+        file_hash = hash_file(filepath)
+        self.entries[filepath] = {"mtime": stat.st_mtime_ns, "size": stat.st_size, "hash": file_hash}
+        self.changed = True
+        return file_hash
+
+    def save(self):
+        if not self.changed:
+            return
+        try:
+            with open(self.path, 'w') as cache_file:
+                json.dump(self.entries, cache_file)
+            self.changed = False
+        except OSError as error:
+            print(f"Clean Textures: hash cache not saved ({error})")
+
+
+def get_image_hash_cache_path():
+    """Sidecar next to the .blend file, temp dir for unsaved files"""
+    if bpy.data.filepath:
+        return bpy.data.filepath + ".bbg_hashes.json"
+    return os.path.join(bpy.app.tempdir or tempfile.gettempdir(), "bbg_hashes.json")
+
+
+def get_image_content_hash(image, cache):
+    """Hash of packed bytes or of the file on disk, None if not available"""
+    if image.source != 'FILE':
+        return None
+    if image.packed_file:
+        return hash_bytes(image.packed_file.data)
+
+    filepath = os.path.normpath(bpy.path.abspath(image.filepath, library=image.library))
+    if not os.path.isfile(filepath):
+        return None
+    return cache.get_hash(filepath)
+
+
+def build_image_remap_by_content():
+    """Image -> first image with the same content (and color settings)"""
+    cache = ImageHashCache(get_image_hash_cache_path())
+    duplicate_rule = DUPLICATE_REGEX
+
+    groups = {}
+    for image in bpy.data.images:
+        content_hash = get_image_content_hash(image, cache)
+        if content_hash is None:
+            continue
+        # Same file with other color space or alpha is not a duplicate
+        key = (content_hash, image.colorspace_settings.name, image.alpha_mode)
+        groups.setdefault(key, []).append(image)
+
+    cache.save()
+
+    remap = {}
+    for images in groups.values():
+        if len(images) < 2:
+            continue
+        # Keep the image without .00x suffix, then by name
+        images.sort(key=lambda image: (duplicate_rule.match(image.name) is not None, image.name))
+        for image in images[1:]:
+            remap[image] = images[0]
+    return remap
+
+
+def remap_image_users(remap):
+    """Replace every use of each duplicate image with its base (ID.user_remap: nodes, textures, UV editors, ...)
+    and remove the duplicates in one batch. Returns replaced reference count"""
+    replaced_count = 0
+    for image, base_image in remap.items():
+        replaced_count += image.users - image.use_fake_user
+        image.user_remap(base_image)
+
+    bpy.data.batch_remove(list(remap))
+
+    return replaced_count
+
+
 def CleanTexturesRegister():
     bpy.utils.register_class(CleanTextures)
 
+    bpy.types.Scene.clean_textures_by_content = bpy.props.BoolProperty(
+        name="clean_textures_by_content",
+        description="Find texture duplicates by file content instead of the .00x suffix",
+        default=False
+    )
+
 def CleanTexturesUnregister():
     bpy.utils.unregister_class(CleanTextures)
 
+    del bpy.types.Scene.clean_textures_by_content
+
 #---------------------------------------------------
 # /CleanTextures
 #---------------------------------------------------
@@ -1372,6 +2915,11 @@ class LODObjectPickerPanel(bpy.types.Panel):
         
         
         layout.prop(context.scene, "apply_decimate", text="Decimate")
+        if context.scene.apply_decimate:
+            decimateBox = layout.box()
+            decimateBox.prop(context.scene, "lod_budget_mode", text="Budget")
+            decimateBox.prop(context.scene, "lod_budgets", text="LOD1+")
+            decimateBox.prop(context.scene, "lod_workers", text="Workers")
 
         
         layout.prop(context.scene, "inverse_matrix", text="Inverse Matrix")
@@ -1394,6 +2942,8 @@ class AddLODSuffix(bpy.types.Operator):
         num_lods = context.scene.num_lods
         apply_decimate = context.scene.apply_decimate
         inverse_matrix = context.scene.inverse_matrix
+        budget_mode = context.scene.lod_budget_mode
+        workers = context.scene.lod_workers
 
         if not selected_object:
             self.report({'ERROR'}, "No object selected!")
@@ -1403,6 +2953,17 @@ class AddLODSuffix(bpy.types.Operator):
             self.report({'ERROR'}, "Number of LODs must be at least 1!")
             return {'CANCELLED'}
 
+        try:
+            budgets = parse_lod_budgets(context.scene.lod_budgets)
+        except ValueError:
+            self.report({'ERROR'}, "LOD budgets must be positive numbers separated by commas!")
+            return {'CANCELLED'}
+
+        # (LOD object, source mesh, LOD level) decimated after the hierarchy is built
+        decimate_jobs = []
+        # (source mesh, LOD level) -> LOD mesh, when not decimated
+        lod_meshes = {}
+
         # Create an empty object with the same rotation and location as the original object
         def create_empty_for_object(obj):
             empty = bpy.data.objects.new(obj.name + "_LOD_Empty", None)  # Name with _LOD_Empty
@@ -1445,8 +3006,13 @@ class AddLODSuffix(bpy.types.Operator):
                 else:
                     # Duplicate object and rename with _LODx suffix
                     for i in range(num_lods):
-                        new_obj = obj.copy()
-                        new_obj.data = obj.data.copy()  # Duplicate mesh data for LODs
+                        new_obj = obj.copy()  # Shares the original mesh data-block
+                        if i > 0 and not apply_decimate:
+                            # One copy per source mesh and LOD level, shared by instanced objects
+                            key = (obj.data, i)
+                            if key not in lod_meshes:
+                                lod_meshes[key] = obj.data.copy()
+                            new_obj.data = lod_meshes[key]
                         new_obj.name = obj.name + f'_LOD{i}'
                         bpy.context.collection.objects.link(new_obj)  # Link the new object to the same collection
                         # Parent LOD duplicates to the empty with "Keep Transform"
@@ -1454,14 +3020,9 @@ class AddLODSuffix(bpy.types.Operator):
                         new_obj.matrix_parent_inverse = empty.matrix_world.inverted()
                         set_lod_locpos(new_obj)
                         
-                        # Apply Decimate modifier based on LOD level if checkbox is checked
-                        if apply_decimate and '_LOD' in new_obj.name:
-                            if i == 1:
-                                decimate_modifier = new_obj.modifiers.new(name="Decimate", type='DECIMATE')
-                                decimate_modifier.ratio = 0.7  # 0.7 for LOD1
-                            elif i > 1:
-                                decimate_modifier = new_obj.modifiers.new(name="Decimate", type='DECIMATE')
-                                decimate_modifier.ratio = 0.4  # 0.4 for LOD2 and beyond
+                        # Queue decimation based on LOD level if checkbox is checked
+                        if apply_decimate and i > 0:
+                            decimate_jobs.append((new_obj, obj.data, i))
 
                         # If it's LOD0, transfer the original mesh data-block from _OLD object
                         if i == 0:
@@ -1481,8 +3042,157 @@ class AddLODSuffix(bpy.types.Operator):
 
         add_suffix_to_mesh(selected_object)
 
+        # Decimate all LOD meshes at once (in worker processes for large hierarchies)
+        if decimate_jobs:
+            start = time.perf_counter()
+            mesh_count = build_lod_meshes(decimate_jobs, budgets, budget_mode, workers, self.report)
+            self.report({'INFO'}, f"{mesh_count} LOD meshes for {len(decimate_jobs)} objects decimated in {time.perf_counter() - start:.2f} s")
+
         return {'FINISHED'}
 
+
+#---------------LOD build pipeline--------------------
+
+LOD_DECIMATE_MODIFIER = "BBG_Decimate"
+LOD_PARALLEL_MIN_MESHES = 64
+LOD_WORKER_TIMEOUT = 600
+LOD_WORKER_STDERR_LINES = 5
+LOD_WORKER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "lod_worker.py")
+
+
+def parse_lod_budgets(text):
+    """'0.7, 0.4' -> [0.7, 0.4], one value per LOD from LOD1, the last repeats"""
+    budgets = [float(value) for value in text.replace(";", ",").split(",") if value.strip()]
+    if not budgets or any(budget <= 0 for budget in budgets):
+        raise ValueError(text)
+    return budgets
+
+
+def count_mesh_triangles(mesh):
+    """Triangle count from polygon sizes without triangulating"""
+    count = len(mesh.polygons)
+    loop_totals = np.empty(count, dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+    return int(loop_totals.sum()) - 2 * count
+
+
+def get_lod_ratio(triangles, level, budgets, budget_mode):
+    """Decimate ratio of a LOD level, budget is a ratio or a triangle count"""
+    budget = budgets[min(level - 1, len(budgets) - 1)]
+    if budget_mode == 'TRIANGLES':
+        return min(1.0, budget / max(1, triangles))
+    return min(1.0, budget)
+
+
+def decimate_meshes(jobs):
+    """[(source mesh, ratio, name)] -> new decimated meshes, applied from evaluated copies"""
+    collection = bpy.context.scene.collection
+
+    # Temporary objects carry only the Decimate modifier
+    temp_objects = []
+    for mesh, ratio, name in jobs:
+        temp_obj = bpy.data.objects.new(name, mesh)
+        modifier = temp_obj.modifiers.new(LOD_DECIMATE_MODIFIER, 'DECIMATE')
+        modifier.ratio = ratio
+        collection.objects.link(temp_obj)
+        temp_objects.append(temp_obj)
+
+    # One depsgraph evaluation for all meshes
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+
+    results = []
+    for temp_obj, (mesh, ratio, name) in zip(temp_objects, jobs):
+        result = bpy.data.meshes.new_from_object(temp_obj.evaluated_get(depsgraph), preserve_all_data_layers=True, depsgraph=depsgraph)
+        result.name = name
+        results.append(result)
+
+    bpy.data.batch_remove(temp_objects)
+    return results
+
+
+def decimate_meshes_parallel(jobs, workers, report=None):
+    """decimate_meshes split across background Blender processes.
+    Failed workers are reported (operator report callback) and their chunk is decimated here"""
+    temp_dir = tempfile.mkdtemp(prefix="bbg_lod_")
+    try:
+        source_path = os.path.join(temp_dir, "source.blend")
+        bpy.data.libraries.write(source_path, {mesh for mesh, _, _ in jobs}, fake_user=True)
+
+        numbered_jobs = list(enumerate(jobs))
+        chunks = [numbered_jobs[k::workers] for k in range(workers)]
+        chunks = [chunk for chunk in chunks if chunk]
+
+        def run_chunk(k, chunk):
+            job_path = os.path.join(temp_dir, f"jobs_{k}.json")
+            output_path = os.path.join(temp_dir, f"result_{k}.blend")
+            with open(job_path, 'w') as job_file:
+                json.dump([{"mesh": mesh.name, "ratio": ratio, "result": f"BBG_LOD_{n}"} for n, (mesh, ratio, _) in chunk], job_file)
+            command = [bpy.app.binary_path, "--background", "--factory-startup", "--python", LOD_WORKER_SCRIPT,
+                       "--", source_path, job_path, output_path]
+            try:
+                completed = subprocess.run(command, capture_output=True, text=True, errors="replace", timeout=LOD_WORKER_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                return None, f"timed out after {LOD_WORKER_TIMEOUT} s"
+            if completed.returncode != 0 or not os.path.exists(output_path):
+                stderr_tail = "\n".join(completed.stderr.strip().splitlines()[-LOD_WORKER_STDERR_LINES:])
+                return None, f"exit code {completed.returncode}: {stderr_tail or 'no output'}"
+            return output_path, None
+
+        # Threads only wait on the processes, reports are made here in the main thread
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+            outputs = list(executor.map(run_chunk, range(len(chunks)), chunks))
+
+        results = [None] * len(jobs)
+        for k, (chunk, (output_path, error)) in enumerate(zip(chunks, outputs)):
+            if output_path is None:
+                # Worker failed, decimate this chunk here
+                message = f"LOD worker {k} failed ({error}), decimating {len(chunk)} meshes locally"
+                print(message)
+                if report is not None:
+                    report({'WARNING'}, message)
+                local_results = decimate_meshes([job for _, job in chunk])
+            else:
+                with bpy.data.libraries.load(output_path) as (data_from, data_to):
+                    data_to.meshes = [f"BBG_LOD_{n}" for n, _ in chunk]
+                local_results = data_to.meshes
+
+            for (n, (mesh, _, name)), result in zip(chunk, local_results):
+                result.name = name
+                # Workers drop material slots to avoid duplicate materials, restore the originals
+                for slot_index, material in enumerate(mesh.materials):
+                    if slot_index < len(result.materials):
+                        result.materials[slot_index] = material
+                results[n] = result
+
+        return results
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def build_lod_meshes(decimate_jobs, budgets, budget_mode, workers=1, report=None):
+    """Replace LOD object meshes with decimated meshes [(LOD object, source mesh, level)]
+
+    Each source mesh and level is decimated once, instanced objects share the result.
+    """
+    job_indices = {}
+    jobs = []
+    for lod_obj, source_mesh, level in decimate_jobs:
+        key = (source_mesh, level)
+        if key not in job_indices:
+            ratio = get_lod_ratio(count_mesh_triangles(source_mesh), level, budgets, budget_mode)
+            job_indices[key] = len(jobs)
+            jobs.append((source_mesh, ratio, lod_obj.name))
+
+    if workers > 1 and len(jobs) >= LOD_PARALLEL_MIN_MESHES and bpy.app.binary_path:
+        results = decimate_meshes_parallel(jobs, workers, report)
+    else:
+        results = decimate_meshes(jobs)
+
+    for lod_obj, source_mesh, level in decimate_jobs:
+        lod_obj.data = results[job_indices[(source_mesh, level)]]
+
+    return len(jobs)
+
 class RemoveOldObjects(bpy.types.Operator):
     """Remove all objects with _OLD suffix under Target"""
     bl_idname = "object.remove_old_objects"
@@ -1515,12 +3225,12 @@ class RemoveOldObjects(bpy.types.Operator):
         return {'FINISHED'}
     
     
-def search_for_old_objects(objects_to_check):
+def search_for_old_objects(records_to_check):
     invalid_objects = []
     
-    for obj in objects_to_check:
-        if obj.name.endswith('_OLD'):
-            invalid_objects.append(obj)
+    for record in records_to_check:
+        if record.is_old:
+            invalid_objects.append(record.obj)
             
     return invalid_objects
 
@@ -1533,6 +3243,25 @@ def LodRegister():
     bpy.types.Scene.num_lods = bpy.props.IntProperty(name="Number of LODs", default=2, min=1)
     bpy.types.Scene.apply_decimate = bpy.props.BoolProperty(name="Decimate", default=False)
     bpy.types.Scene.inverse_matrix = bpy.props.BoolProperty(name="", default=False)
+    bpy.types.Scene.lod_budget_mode = bpy.props.EnumProperty(
+        name="LOD Budget",
+        description="How LOD budgets are read",
+        items=[
+        ('RATIO', "Ratio", "Decimate ratio per LOD level"),
+        ('TRIANGLES', "Triangles", "Triangle budget per mesh and LOD level")
+        ]
+    )
+    bpy.types.Scene.lod_budgets = bpy.props.StringProperty(
+        name="LOD Budgets",
+        description="Budget per LOD level from LOD1, comma separated, the last value repeats",
+        default="0.7, 0.4"
+    )
+    bpy.types.Scene.lod_workers = bpy.props.IntProperty(
+        name="Workers",
+        description="Background Blender processes for large hierarchies (1 = no workers)",
+        default=1,
+        min=1
+    )
 
 def LodUnregister():
     bpy.utils.unregister_class(AddLODSuffix)
@@ -1542,6 +3271,9 @@ def LodUnregister():
     del bpy.types.Scene.num_lods
     del bpy.types.Scene.apply_decimate
     del bpy.types.Scene.inverse_matrix
+    del bpy.types.Scene.lod_budget_mode
+    del bpy.types.Scene.lod_budgets
+    del bpy.types.Scene.lod_workers
 
 #---------------------------------------------------
 # /LOD
@@ -1552,6 +3284,238 @@ def LodUnregister():
 # LOD Groups
 #---------------------------------------------------
 
+class LODRegistry:
+    """LOD level -> objects, built once and updated from depsgraph and name changes"""
+
+    def __init__(self):
+        self.valid = False
+        self.object_count = 0
+        self.levels = {}          # level -> {object pointer: object}
+        self.object_levels = {}   # object pointer -> level
+        self.visible = {}         # level -> cached visibility
+        self.stats = None         # last LOD statistics report, see compute_lod_stats
+
+    def ensure(self):
+        if not self.valid:
+            self.rebuild()
+
+    def rebuild(self):
+        self.__init__()
+        for obj in bpy.data.objects:
+            level = get_lod_level(obj.name)
+            if level is not None:
+                pointer = obj.as_pointer()
+                self.levels.setdefault(level, {})[pointer] = obj
+                self.object_levels[pointer] = level
+        self.object_count = len(bpy.data.objects)
+        self.valid = True
+
+    def update_object(self, obj):
+        # Level changed by a rename, rebuild on next use
+        if get_lod_level(obj.name) != self.object_levels.get(obj.as_pointer()):
+            self.valid = False
+
+    def get_levels(self):
+        self.ensure()
+        return sorted(self.levels)
+
+    def get_objects(self, level):
+        self.ensure()
+        return list(self.levels.get(level, {}).values())
+
+    def get_all_objects(self):
+        self.ensure()
+        return [obj for objects in self.levels.values() for obj in objects.values()]
+
+    def get_layer_objects(self, level, view_layer):
+        """Objects of the level in the view layer, renamed objects not yet seen by msgbus are skipped"""
+        self.ensure()
+        layer_objects = view_layer.objects
+        objects = []
+        for obj in self.levels.get(level, {}).values():
+            if get_lod_level(obj.name) != level:
+                self.valid = False
+            elif obj.name in layer_objects:
+                objects.append(obj)
+        return objects
+
+    def is_visible(self, level):
+        """Any object of the level visible in the view layer, cached until the next depsgraph update"""
+        self.ensure()
+        visible = self.visible.get(level)
+        if visible is None:
+            view_layer = bpy.context.view_layer
+            visible = any(obj.visible_get(view_layer=view_layer) for obj in self.get_layer_objects(level, view_layer))
+            self.visible[level] = visible
+        return visible
+
+    def get_level_collections(self, level, objects, view_layer):
+        """Layer collections holding only objects of the level (no child collections), and the objects
+        linked to no other collection, which these layer collections hide as a whole"""
+        layer_collections = {}
+        stack = list(view_layer.layer_collection.children)
+        while stack:
+            layer_collection = stack.pop()
+            layer_collections[layer_collection.collection] = layer_collection
+            stack.extend(layer_collection.children)
+
+        level_collections = {}
+        for obj in objects:
+            for collection in obj.users_collection:
+                if collection not in level_collections:
+                    level_collections[collection] = (
+                        collection in layer_collections and not collection.children and
+                        all(self.object_levels.get(member.as_pointer()) == level for member in collection.objects))
+
+        covered = [obj for obj in objects if all(level_collections[collection] for collection in obj.users_collection)]
+        return [layer_collections[collection] for collection, only_level in level_collections.items() if only_level], covered
+
+    def set_hidden(self, levels, hidden):
+        """Hide or show whole levels in the current view layer. Levels kept in their own collections are
+        toggled with one LayerCollection.hide_viewport per collection, other objects with hide_set (as the H key)"""
+        self.ensure()
+        view_layer = bpy.context.view_layer
+        for level in levels:
+            objects = self.get_layer_objects(level, view_layer)
+            layer_collections, covered = self.get_level_collections(level, objects, view_layer)
+            for layer_collection in layer_collections:
+                layer_collection.hide_viewport = hidden
+
+            # Hidden with their collections, only objects hidden on their own are shown again
+            covered = set(covered)
+            for obj in objects:
+                if obj.hide_get() != hidden and not (hidden and obj in covered):
+                    obj.hide_set(hidden)
+            self.visible[level] = bool(objects) and not hidden
+
+
+def get_lod_level(name):
+    """LOD level from the _LODn suffix, None if not a LOD"""
+    match = LOD_SUFFIX_REGEX.search(name)
+    return int(match.group(1)) if match else None
+
+
+def get_lod_chain_name(name):
+    """Name without the _LODn suffix, shared by all levels of one chain"""
+    return LOD_SUFFIX_REGEX.sub("", name)
+
+
+def get_mesh_stats(mesh):
+    """(triangles, vertices, used material slots) of mesh data, modifiers not applied"""
+    mesh.calc_loop_triangles()
+    material_indices = np.empty(len(mesh.loop_triangles), dtype=np.int32)
+    mesh.loop_triangles.foreach_get("material_index", material_indices)
+    return len(material_indices), len(mesh.vertices), len(np.unique(material_indices))
+
+
+def compute_lod_stats(objects, min_reduction):
+    """Triangles, vertices and material slots per LOD object, level and chain
+
+    A chain is flagged when a level keeps more than (1 - min_reduction) of the
+    previous level's triangles.
+    """
+    mesh_stats = {}
+    object_stats = []
+    levels = {}
+    chains = {}
+
+    for obj in objects:
+        if obj.type != 'MESH':
+            continue
+        level = get_lod_level(obj.name)
+        if obj.data not in mesh_stats:
+            mesh_stats[obj.data] = get_mesh_stats(obj.data)
+        triangles, vertices, material_slots = mesh_stats[obj.data]
+        chain = get_lod_chain_name(obj.name)
+
+        object_stats.append({"name": obj.name, "chain": chain, "level": level, "triangles": triangles,
+                             "vertices": vertices, "material_slots": material_slots})
+
+        level_stats = levels.setdefault(level, {"objects": 0, "triangles": 0, "vertices": 0, "material_slots": 0})
+        level_stats["objects"] += 1
+        level_stats["triangles"] += triangles
+        level_stats["vertices"] += vertices
+        level_stats["material_slots"] += material_slots
+
+        chains.setdefault(chain, {})[level] = triangles
+
+    # Reduction between neighbouring levels
+    sorted_levels = sorted(levels)
+    for previous, level in zip(sorted_levels, sorted_levels[1:]):
+        previous_triangles = levels[previous]["triangles"]
+        levels[level]["ratio"] = levels[level]["triangles"] / previous_triangles if previous_triangles else None
+
+    inadequate = []
+    for chain, chain_levels in sorted(chains.items()):
+        chain_sorted = sorted(chain_levels)
+        for previous, level in zip(chain_sorted, chain_sorted[1:]):
+            previous_triangles = chain_levels[previous]
+            if previous_triangles and chain_levels[level] / previous_triangles > 1.0 - min_reduction:
+                inadequate.append({"chain": chain, "level": level, "ratio": chain_levels[level] / previous_triangles})
+
+    return {
+        "min_reduction": min_reduction,
+        "levels": {level: levels[level] for level in sorted_levels},
+        "inadequate": inadequate,
+        "objects": object_stats,
+    }
+
+
+LOD_REGISTRY = LODRegistry()
+LOD_MSGBUS_OWNER = object()
+
+
+@bpy.app.handlers.persistent
+def lod_registry_depsgraph_update(scene, depsgraph):
+    if not LOD_REGISTRY.valid:
+        return
+
+    # Objects added or removed
+    if len(bpy.data.objects) != LOD_REGISTRY.object_count:
+        LOD_REGISTRY.valid = False
+        return
+
+    for update in depsgraph.updates:
+        if isinstance(update.id, bpy.types.Object):
+            LOD_REGISTRY.update_object(update.id.original)
+
+    # Hide state changes tag the scene, not the objects
+    LOD_REGISTRY.visible.clear()
+
+
+def lod_registry_name_changed():
+    LOD_REGISTRY.valid = False
+
+
+def subscribe_lod_registry_names():
+    bpy.msgbus.clear_by_owner(LOD_MSGBUS_OWNER)
+    bpy.msgbus.subscribe_rna(key=(bpy.types.Object, "name"), owner=LOD_MSGBUS_OWNER, args=(), notify=lod_registry_name_changed)
+
+
+@bpy.app.handlers.persistent
+def lod_registry_reset(*args):
+    """New file or undo step, object references are no longer valid"""
+    LOD_REGISTRY.valid = False
+    subscribe_lod_registry_names()
+
+
+def lod_registry_register_handlers():
+    bpy.app.handlers.depsgraph_update_post.append(lod_registry_depsgraph_update)
+    for handlers in (bpy.app.handlers.load_post, bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        handlers.append(lod_registry_reset)
+    subscribe_lod_registry_names()
+
+
+def lod_registry_unregister_handlers():
+    if lod_registry_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(lod_registry_depsgraph_update)
+    for handlers in (bpy.app.handlers.load_post, bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        if lod_registry_reset in handlers:
+            handlers.remove(lod_registry_reset)
+    bpy.msgbus.clear_by_owner(LOD_MSGBUS_OWNER)
+    LOD_REGISTRY.valid = False
+
+
 class LODGroupsPanel(bpy.types.Panel):
     """Creates a Panel in the Object properties window"""
     bl_label = "LOD Groups"
@@ -1569,62 +3533,44 @@ class LODGroupsPanel(bpy.types.Panel):
         
         groupBox = layout.box()
         
+        levels = LOD_REGISTRY.get_levels()
         
+        if not levels:
+            groupBox.label(text="No LOD objects")
         
-        lod0Split = groupBox.row().split(factor = 0.3, align=True)
-        lod1Split = groupBox.row().split(factor = 0.3, align=True)
-        lod2Split = groupBox.row().split(factor = 0.3, align=True)
-        lod3Split = groupBox.row().split(factor = 0.3, align=True)
-        
-        # --------------------LOD0--------------------------------
-        lod0Split.label(text="LOD0")
-        lod0_visible = any(obj for obj in bpy.data.objects if "_LOD0" in obj.name and not obj.hide_get())
+        # One row per LOD level found in the scene
+        for level in levels:
+            lodSplit = groupBox.row().split(factor = 0.3, align=True)
+            lodSplit.label(text=f"LOD{level}")
+            lod_visible = LOD_REGISTRY.is_visible(level)
 
-        # visible button
-        lod0_visible_operator = lod0Split.operator("object.lod_groups_toggle_visibility", text="", icon='HIDE_OFF' if lod0_visible else 'HIDE_ON')
-        lod0_visible_operator.lodGroup = "_LOD0"
-            
-        # select button
-        lod0_select_operator = lod0Split.operator("object.lod_groups_select", text="", icon='RESTRICT_SELECT_OFF')
-        lod0_select_operator.lodGroup = "_LOD0"
-        
-        # --------------------LOD1--------------------------------
-        lod1Split.label(text= "LOD1")
-        lod1_visible = any(obj for obj in bpy.data.objects if "_LOD1" in obj.name and not obj.hide_get())
-        
-        # visible button
-        lod1_visible_operator = lod1Split.operator("object.lod_groups_toggle_visibility", text="", icon='HIDE_OFF' if lod1_visible else 'HIDE_ON')
-        lod1_visible_operator.lodGroup = "_LOD1"
-        
-        # select button
-        lod1_select_operator = lod1Split.operator("object.lod_groups_select", text="", icon='RESTRICT_SELECT_OFF')
-        lod1_select_operator.lodGroup = "_LOD1"
-        
-        # --------------------LOD2--------------------------------
-        lod2Split.label(text= "LOD2")
-        lod2_visible = any(obj for obj in bpy.data.objects if "_LOD2" in obj.name and not obj.hide_get())
-        
-        # visible button
-        lod2_visible_operator = lod2Split.operator("object.lod_groups_toggle_visibility", text="", icon='HIDE_OFF' if lod2_visible else 'HIDE_ON')
-        lod2_visible_operator.lodGroup = "_LOD2"
-        
-        # select button
-        lod2_select_operator = lod2Split.operator("object.lod_groups_select", text="", icon='RESTRICT_SELECT_OFF')
-        lod2_select_operator.lodGroup = "_LOD2"
-        
-        # --------------------LOD3--------------------------------
-        lod3Split.label(text= "LOD3")
-        lod3_visible = any(obj for obj in bpy.data.objects if "_LOD3" in obj.name and not obj.hide_get())
-        
-        # visible button
-        lod3_visible_operator = lod3Split.operator("object.lod_groups_toggle_visibility", text="", icon='HIDE_OFF' if lod3_visible else 'HIDE_ON')
-        lod3_visible_operator.lodGroup = "_LOD3"
-        
-        # select button
-        lod3_select_operator = lod3Split.operator("object.lod_groups_select", text="", icon='RESTRICT_SELECT_OFF')
-        lod3_select_operator.lodGroup = "_LOD3"
+            # visible button
+            lod_visible_operator = lodSplit.operator("object.lod_groups_toggle_visibility", text="", icon='HIDE_OFF' if lod_visible else 'HIDE_ON')
+            lod_visible_operator.lod_level = level
+                
+            # select button
+            lod_select_operator = lodSplit.operator("object.lod_groups_select", text="", icon='RESTRICT_SELECT_OFF')
+            lod_select_operator.lod_level = level
         
         groupBox.operator("object.unhide_lod_objects", text="RESET")
+
+        # LOD statistics
+        statsBox = layout.box()
+        statsRow = statsBox.row(align=True)
+        statsRow.prop(context.scene, "lod_min_reduction", text="Min reduction")
+        statsRow.operator("object.lod_stats", text="", icon='FILE_REFRESH')
+        statsRow.operator("object.lod_stats_export", text="", icon='EXPORT')
+
+        stats = LOD_REGISTRY.stats
+        if stats:
+            for level, level_stats in stats["levels"].items():
+                ratio = level_stats.get("ratio")
+                ratio_text = f"  {ratio:.0%}" if ratio is not None else ""
+                statsBox.label(text=f"LOD{level}: {level_stats['triangles']} tris, {level_stats['vertices']} verts{ratio_text}")
+            for entry in stats["inadequate"][:LOD_STATS_MAX_LINES]:
+                statsBox.label(text=f"{entry['chain']} LOD{entry['level']}: {entry['ratio']:.0%}", icon='ERROR')
+            if len(stats["inadequate"]) > LOD_STATS_MAX_LINES:
+                statsBox.label(text=f"... {len(stats['inadequate']) - LOD_STATS_MAX_LINES} more", icon='ERROR')
         
 class LodSelectGroupOperator(bpy.types.Operator):
     """Select LOD Group"""
@@ -1632,37 +3578,22 @@ class LodSelectGroupOperator(bpy.types.Operator):
     bl_label = ""
     bl_options = {'REGISTER', 'UNDO'}
     
-    lodGroup: bpy.props.StringProperty(name="_LODX")
+    lod_level: bpy.props.IntProperty(name="LOD Level", min=0)
     
     def execute(self, context):
         
-        target_lod = self.lodGroup.strip()
-        
-        lods = [obj for obj in bpy.data.objects if target_lod in obj.name]
+        # Only objects of the view layer can be selected
+        lod_objects = LOD_REGISTRY.get_layer_objects(self.lod_level, context.view_layer)
         
         bpy.ops.object.select_all(action='DESELECT')
 
-        lod_objects = lods
-
         for obj in lod_objects:
             obj.select_set(True)
 
         if lod_objects:
-            bpy.context.view_layer.objects.active = lod_objects[-1]
+            context.view_layer.objects.active = lod_objects[-1]
         
         return {'FINISHED'}
-    
-    def selectLODs(self, lodsToSelect):
-        
-        bpy.ops.object.select_all(action='DESELECT')
-
-        lod_objects = lodsToSelect
-
-        for obj in lod_objects:
-            obj.select_set(True)
-
-        if lod_objects:
-            bpy.context.view_layer.objects.active = lod_objects[-1]
             
 class LodToggleVisibilityOperator(bpy.types.Operator):
     """Toggle visibility of LOD group"""
@@ -1670,24 +3601,14 @@ class LodToggleVisibilityOperator(bpy.types.Operator):
     bl_label = ""
     bl_options = {'REGISTER', 'UNDO'}
     
-    lodGroup: bpy.props.StringProperty(name="_LODX")
+    lod_level: bpy.props.IntProperty(name="LOD Level", min=0)
 
     def execute(self, context):
-        # Ensure the search string is stripped of spaces
-        target_name = self.lodGroup.strip()
-
-        lods = [obj for obj in bpy.data.objects if target_name in obj.name]
-
-        if not lods:
+        if not LOD_REGISTRY.get_objects(self.lod_level):
             return {'CANCELLED'}
         
-        
-        # Determine the current visibility state (check the first object's state)
-        new_visibility = not lods[0].hide_get()
-
-        # Toggle visibility for all matching objects
-        for obj in lods:
-            obj.hide_set(new_visibility)  # Hide/unhide in viewport
+        # Hide the whole group if any of it is visible
+        LOD_REGISTRY.set_hidden([self.lod_level], LOD_REGISTRY.is_visible(self.lod_level))
 
         return {'FINISHED'}
     
@@ -1697,23 +3618,81 @@ class UnhideLODObjectsOperator(bpy.types.Operator):
     bl_label = "Unhide LOD Objects"
     
     def execute(self, context):
-        # Loop through all objects in the scene
-        for obj in bpy.context.scene.objects:
-            if "_LOD" in obj.name and obj.hide_get():
-                obj.hide_set(False)  # Unhide the object
+        # Show all LOD levels in one batch
+        LOD_REGISTRY.set_hidden(LOD_REGISTRY.get_levels(), False)
         return {'FINISHED'}                    
 
+LOD_STATS_MAX_LINES = 10
+
+
+class LodStatsOperator(bpy.types.Operator):
+    """Count triangles, vertices and material slots per LOD level"""
+    bl_idname = "object.lod_stats"
+    bl_label = "LOD Statistics"
+
+    def execute(self, context):
+        LOD_REGISTRY.stats = compute_lod_stats(LOD_REGISTRY.get_all_objects(), context.scene.lod_min_reduction)
+
+        inadequate = len(LOD_REGISTRY.stats["inadequate"])
+        if inadequate:
+            self.report({'WARNING'}, f"{inadequate} LOD levels reduce less than {context.scene.lod_min_reduction:.0%}")
+        else:
+            self.report({'INFO'}, "All LOD chains reduce enough")
+        return {'FINISHED'}
+
+
+class LodStatsExportOperator(bpy.types.Operator):
+    """Export LOD statistics as JSON"""
+    bl_idname = "object.lod_stats_export"
+    bl_label = "Export LOD Statistics"
+
+    filepath: bpy.props.StringProperty(subtype='FILE_PATH')
+    filter_glob: bpy.props.StringProperty(default="*.json", options={'HIDDEN'})
+
+    def invoke(self, context, event):
+        if not self.filepath:
+            blend_name = os.path.splitext(os.path.basename(bpy.data.filepath))[0] or "untitled"
+            self.filepath = blend_name + "_lod_stats.json"
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+    def execute(self, context):
+        stats = compute_lod_stats(LOD_REGISTRY.get_all_objects(), context.scene.lod_min_reduction)
+        LOD_REGISTRY.stats = stats
+
+        with open(bpy.path.abspath(self.filepath), 'w') as stats_file:
+            json.dump(dict(stats, file=bpy.data.filepath), stats_file, indent=2)
+
+        self.report({'INFO'}, f"LOD statistics written to {self.filepath}")
+        return {'FINISHED'}
+
+
 def LODGroupsRegister():
     bpy.utils.register_class(LODGroupsPanel)
     bpy.utils.register_class(UnhideLODObjectsOperator)
     bpy.utils.register_class(LodSelectGroupOperator)
     bpy.utils.register_class(LodToggleVisibilityOperator)
+    bpy.utils.register_class(LodStatsOperator)
+    bpy.utils.register_class(LodStatsExportOperator)
+    bpy.types.Scene.lod_min_reduction = bpy.props.FloatProperty(
+        name="Min LOD Reduction",
+        description="Triangles each LOD level must remove compared to the previous level",
+        default=0.3,
+        min=0.0,
+        max=1.0,
+        subtype='FACTOR'
+    )
+    lod_registry_register_handlers()
     
 def LODGroupsUnregister():
+    lod_registry_unregister_handlers()
     bpy.utils.unregister_class(LODGroupsPanel)
     bpy.utils.unregister_class(UnhideLODObjectsOperator)
     bpy.utils.unregister_class(LodSelectGroupOperator)
     bpy.utils.unregister_class(LodToggleVisibilityOperator)
+    bpy.utils.unregister_class(LodStatsOperator)
+    bpy.utils.unregister_class(LodStatsExportOperator)
+    del bpy.types.Scene.lod_min_reduction
     
 
 #---------------------------------------------------
@@ -1849,6 +3828,9 @@ def register():
     LodRegister()
     LODGroupsRegister()
     SelectActiveMaterialInSceneRegister()
+    LiveChecksRegister()
+    CheckReportRegister()
+    ProfilingRegister()
     
     
 
@@ -1867,6 +3849,9 @@ def unregister():
     LodUnregister()
     LODGroupsUnregister()
     SelectActiveMaterialInSceneUnregister()
+    LiveChecksUnregister()
+    CheckReportUnregister()
+    ProfilingUnregister()
     
 
 # TURN ON IF TESTING IN BLENDER 
@@ -0,0 +1,295 @@
+""" Headless batch validator for directories of .blend files
+
+Runs the export checks (root, materials, scales, colliders, textures, _OLD)
+on every .blend file under a directory, one Blender process per worker.
+
+Usage:
+    blender --background --python batch_validate.py -- <directory> [options]
+
+Options:
+    --mode FINAL|PROTOTYPE      Export mode used for the checks (default FINAL)
+    --jobs N                    Number of Blender worker processes (default CPU count)
+    --files-per-process N       .blend files opened by one Blender process (default 8)
+    --timeout SECONDS           Timeout of one worker process (default 600)
+    --json PATH                 Write JSON report
+    --csv PATH                  Write CSV report
+    --junit PATH                Write JUnit XML report (needs the driver to run inside Blender)
+    --blender PATH              Blender executable (default: the running Blender)
+"""
+
+import argparse
+import concurrent.futures
+import csv
+import json
+import os
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from script_common import get_script_args, load_checks_module
+
+
+RESULT_PREFIX = "BBG_RESULT:"
+
+EXPORT_MODES = {
+    "FINAL": 'OP1',
+    "PROTOTYPE": 'OP2',
+}
+
+# Checks that only warn in the export, everything else is an error
+WARNING_CHECKS = {"COLLIDERS", "TEXTURES"}
+
+
+#---------------------------------------------------
+# Arguments
+#---------------------------------------------------
+
+def parse_args(args):
+    parser = argparse.ArgumentParser(prog="batch_validate", description="Validate .blend files with BBG checks")
+    parser.add_argument("directory", nargs="?", help="Directory searched recursively for .blend files")
+    parser.add_argument("--mode", choices=sorted(EXPORT_MODES), default="FINAL")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--files-per-process", type=int, default=8)
+    parser.add_argument("--timeout", type=float, default=600.0)
+    parser.add_argument("--json", dest="json_path")
+    parser.add_argument("--csv", dest="csv_path")
+    parser.add_argument("--junit", dest="junit_path")
+    parser.add_argument("--blender", dest="blender_path")
+    # Internal, used by the spawned Blender processes
+    parser.add_argument("--worker", nargs="+", help=argparse.SUPPRESS)
+    return parser.parse_args(args)
+
+#---------------------------------------------------
+# /Arguments
+#---------------------------------------------------
+
+
+#---------------------------------------------------
+# Worker (inside Blender)
+#---------------------------------------------------
+
+def validate_current_file(checks, mode):
+    """Run all export checks on the open file, returns check results and timings"""
+    import bpy
+
+    context = bpy.context
+
+    # Batch validation covers the whole visible scene, not the saved selection
+    for obj in context.view_layer.objects:
+        obj.select_set(False)
+
+    index = checks.SceneIndex(context, mode)
+    records = index.check_records
+
+    scale_errors, _ = index.run_check("SCALES", checks.get_objects_recursive, True, False, index)
+
+    results = {
+        "ROOT": index.run_check("ROOT", checks.object_root_check, index),
+        "MATERIALS": sorted(index.run_check("MATERIALS", checks.check_material_format, records, mode)),
+        "SCALES": scale_errors,
+        "COLLIDERS": index.run_check("COLLIDERS", checks.check_has_col, records),
+    }
+
+    # Same as the export: texture and _OLD checks only in FINAL mode
+    if mode == 'OP1':
+        results["TEXTURES"] = sorted(index.run_check("TEXTURES", checks.check_albedo_texture_format, records, mode))
+        results["_OLD"] = [obj.name for obj in index.run_check("_OLD", checks.search_for_old_objects, records)]
+
+    timings = {"INDEX": index.build_time}
+    timings.update(index.check_times)
+
+    report = checks.CheckReport("BATCH", checks.get_export_mode_name(mode), bpy.data.filepath)
+    for name, value in results.items():
+        report.add(name, check_passed(name, value), value if isinstance(value, list) else (),
+                   'WARNING' if name in WARNING_CHECKS else 'ERROR', time=timings.get(name, 0.0))
+
+    return results, timings, report.to_dict()
+
+
+def run_worker(files, mode):
+    """Validate each file and print one result line per file"""
+    import bpy
+
+    checks = load_checks_module()
+
+    for filepath in files:
+        result = {"file": filepath, "checks": None, "timings": None, "report": None, "error": None}
+        start = time.perf_counter()
+        try:
+            bpy.ops.wm.open_mainfile(filepath=filepath, load_ui=False)
+            result["checks"], result["timings"], result["report"] = validate_current_file(checks, mode)
+        except Exception as error:
+            result["error"] = str(error)
+        result["time"] = time.perf_counter() - start
+
+        print(RESULT_PREFIX + json.dumps(result), flush=True)
+
+#---------------------------------------------------
+# /Worker (inside Blender)
+#---------------------------------------------------
+
+
+#---------------------------------------------------
+# Driver
+#---------------------------------------------------
+
+def find_blend_files(directory):
+    """All .blend files under directory (backup .blend1 files are skipped)"""
+    blend_files = []
+    for root, _, files in os.walk(directory):
+        for name in files:
+            if name.lower().endswith(".blend"):
+                blend_files.append(os.path.join(root, name))
+    return sorted(blend_files)
+
+
+def get_blender_path(args):
+    if args.blender_path:
+        return args.blender_path
+    try:
+        import bpy
+        return bpy.app.binary_path
+    except ImportError:
+        return "blender"
+
+
+def run_chunk(blender_path, files, mode_name, timeout):
+    """Validate a chunk of files in one background Blender process"""
+    command = [blender_path, "--background", "--factory-startup",
+               "--python", os.path.abspath(__file__), "--", "--mode", mode_name, "--worker"] + files
+
+    results = {}
+    try:
+        completed = subprocess.run(command, capture_output=True, text=True, timeout=timeout)
+        output = completed.stdout
+    except subprocess.TimeoutExpired as error:
+        output = error.stdout.decode() if isinstance(error.stdout, bytes) else (error.stdout or "")
+
+    for line in output.splitlines():
+        if line.startswith(RESULT_PREFIX):
+            result = json.loads(line[len(RESULT_PREFIX):])
+            results[result["file"]] = result
+
+    # Files without a result crashed or timed out the process
+    for filepath in files:
+        if filepath not in results:
+            results[filepath] = {"file": filepath, "checks": None, "timings": None, "report": None,
+                                 "error": "Blender process failed or timed out", "time": None}
+
+    return [results[filepath] for filepath in files]
+
+
+def check_passed(name, value):
+    """Check value to pass/fail (ROOT and COLLIDERS are bools, others lists of offenders)"""
+    if name in {"ROOT", "COLLIDERS"}:
+        return bool(value)
+    return not value
+
+
+def result_passed(result):
+    """Check result of a report dict, only failed ERROR checks fail (warnings pass)"""
+    return result["passed"] or result["severity"] != 'ERROR'
+
+
+def file_passed(result):
+    """Same rule as CheckReport.passed on the file's report dict"""
+    return not result["error"] and all(result_passed(check) for check in result["report"]["results"])
+
+
+def write_json(path, report):
+    with open(path, "w") as report_file:
+        json.dump(report, report_file, indent=2)
+
+
+def write_csv(path, report):
+    with open(path, "w", newline="") as report_file:
+        writer = csv.writer(report_file)
+        writer.writerow(["file", "check", "severity", "passed", "details", "time_ms"])
+        for result in report["files"]:
+            if result["error"]:
+                writer.writerow([result["file"], "LOAD", 'ERROR', False, result["error"], ""])
+                continue
+            for check in result["report"]["results"]:
+                writer.writerow([result["file"], check["check"], check["severity"], result_passed(check),
+                                 ";".join(check["offenders"]), f"{check['time'] * 1000:.3f}"])
+
+
+def write_junit(path, report):
+    """JUnit XML with the add-on's report model, files that failed to load are one failed LOAD check"""
+    checks = load_checks_module()
+    check_reports = []
+    for result in report["files"]:
+        if result.get("report"):
+            check_reports.append(checks.CheckReport.from_dict(result["report"]))
+        else:
+            check_report = checks.CheckReport("BATCH", report["mode"], result["file"])
+            check_report.add("LOAD", False, message=result["error"] or "")
+            check_reports.append(check_report)
+    checks.write_check_reports_junit(path, check_reports)
+
+
+def run_driver(args):
+    if not args.directory:
+        print("batch_validate: directory is required")
+        return 1
+
+    blender_path = get_blender_path(args)
+    blend_files = find_blend_files(args.directory)
+    chunk_size = max(1, args.files_per_process)
+    chunks = [blend_files[i:i + chunk_size] for i in range(0, len(blend_files), chunk_size)]
+
+    print(f"batch_validate: {len(blend_files)} files, {len(chunks)} processes, {args.jobs} jobs")
+
+    start = time.perf_counter()
+    file_results = []
+
+    # Threads only wait on the Blender processes, the work happens in the processes
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, args.jobs)) as executor:
+        futures = [executor.submit(run_chunk, blender_path, chunk, args.mode, args.timeout) for chunk in chunks]
+        for future in concurrent.futures.as_completed(futures):
+            file_results.extend(future.result())
+
+    file_results.sort(key=lambda result: result["file"])
+
+    failed = [result["file"] for result in file_results if not file_passed(result)]
+
+    report = {
+        "directory": os.path.abspath(args.directory),
+        "mode": args.mode,
+        "total_time": time.perf_counter() - start,
+        "files_checked": len(file_results),
+        "files_failed": len(failed),
+        "files": file_results,
+    }
+
+    if args.json_path:
+        write_json(args.json_path, report)
+    if args.csv_path:
+        write_csv(args.csv_path, report)
+    if args.junit_path:
+        write_junit(args.junit_path, report)
+
+    print(f"batch_validate: {len(failed)}/{len(file_results)} files failed in {report['total_time']:.1f} s")
+    for filepath in failed:
+        print("  " + filepath)
+
+    return 1 if failed else 0
+
+#---------------------------------------------------
+# /Driver
+#---------------------------------------------------
+
+
+def main():
+    args = parse_args(get_script_args())
+
+    if args.worker:
+        run_worker(args.worker, EXPORT_MODES[args.mode])
+        return 0
+
+    return run_driver(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,46 @@
+""" Background LOD decimation worker, started by AddLODSuffix
+
+Usage (internal):
+    blender --background --factory-startup --python lod_worker.py -- <source.blend> <jobs.json> <result.blend>
+
+Loads the source meshes, decimates them with the add-on's decimate_meshes and
+writes the results (named as requested in jobs.json) to result.blend.
+"""
+
+import json
+import os
+import sys
+
+import bpy
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from script_common import get_script_args, load_checks_module
+
+
+def main():
+    source_path, job_path, output_path = get_script_args()
+
+    with open(job_path, 'r') as job_file:
+        jobs = json.load(job_file)
+
+    # Empty file, so loaded meshes keep their names
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+
+    mesh_names = sorted({job["mesh"] for job in jobs})
+    with bpy.data.libraries.load(source_path) as (data_from, data_to):
+        data_to.meshes = mesh_names
+    meshes = dict(zip(mesh_names, data_to.meshes))
+
+    checks = load_checks_module()
+    results = checks.decimate_meshes([(meshes[job["mesh"]], job["ratio"], job["result"]) for job in jobs])
+
+    # Material slots are restored from the originals in the main process
+    for result in results:
+        for slot_index in range(len(result.materials)):
+            result.materials[slot_index] = None
+
+    bpy.data.libraries.write(output_path, set(results), fake_user=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+""" Helpers shared by the headless scripts (batch_validate.py, lod_worker.py)
+
+The scripts run in background Blender processes and load BBG.py as a plain
+module, without registering the add-on.
+"""
+
+import importlib.util
+import os
+import sys
+
+
+CHECKS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "BBG.py")
+
+
+def get_script_args():
+    """Arguments after '--', otherwise all arguments (none inside Blender, the rest are Blender's)"""
+    if "--" in sys.argv:
+        return sys.argv[sys.argv.index("--") + 1:]
+    return [] if "bpy" in sys.modules else sys.argv[1:]
+
+
+def load_checks_module(path=CHECKS_PATH):
+    """Load BBG.py (next to this script by default) without registering the add-on"""
+    spec = importlib.util.spec_from_file_location("bbg_checks", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
@@ -0,0 +1,129 @@
+""" Benchmark: CleanMaterials duplicate resolution, 100 to 50k materials
+
+Usage:
+    blender --background --factory-startup --python benchmarks/bench_clean_materials.py -- [--sizes 100 1000 10000 50000] [--legacy-max 5000]
+
+Each scene has N materials: N/5 base materials with four .00x duplicates each,
+assigned to N mesh objects. The previous nested-loop implementation runs up to
+--legacy-max materials and both results (slot assignments, remaining materials)
+are compared.
+"""
+
+import argparse
+import os
+import re
+import sys
+
+import bpy
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from bench_common import get_script_args, load_checks_module, timed
+from scene_generators import COLLIDER_NAME, generate_material_duplicates
+
+
+def scene_setup(count):
+    """Rebuilds the scene before each timed run, returns the clean arguments"""
+    def setup():
+        generate_material_duplicates(count)
+        return bpy.data.objects, COLLIDER_NAME, True
+    return setup
+
+
+def legacy_clean_materials(objects, ColliderMaterial_name, include_name_MATERIAL):
+    """Nested-loop implementation CleanMaterials used before"""
+    replaced_count = 0
+    MATERIAL_name = "Material"
+    allMaterials = {}
+    rex = r"\.\d+$"
+    cleanMaterials = []
+    dirtyMaterials = []
+
+    for obj in objects:
+        if obj.type == 'MESH':
+            for slot in obj.material_slots:
+                if slot.material:
+                    if slot.material.name == ColliderMaterial_name:
+                        obj.data.materials.clear()
+                    else:
+                        if slot.material not in allMaterials:
+                            allMaterials[slot.material] = []
+                        allMaterials[slot.material].append(obj)
+
+    for mat, objects in allMaterials.items():
+        if len(mat.name) > 4:
+            if re.match(rex, mat.name[-4:]):
+                if include_name_MATERIAL:
+                    dirtyMaterials.append(mat)
+                else:
+                    if mat.name[:-4] == MATERIAL_name:
+                        cleanMaterials.append(mat)
+                    else:
+                        dirtyMaterials.append(mat)
+            else:
+                cleanMaterials.append(mat)
+        else:
+            cleanMaterials.append(mat)
+
+    for dirtyMat in dirtyMaterials:
+        found = False
+        for cleanMat in cleanMaterials:
+            if dirtyMat.name[:-4] == cleanMat.name:
+                found = True
+                break
+        if not found:
+            dirtyMat.name = dirtyMat.name[:-4]
+            cleanMaterials.append(dirtyMat)
+
+    for mat, objects in allMaterials.items():
+        if mat not in cleanMaterials:
+            for cleanMat in cleanMaterials:
+                if mat.name[:-4] == cleanMat.name:
+                    for obj in objects:
+                        for slot in obj.material_slots:
+                            if slot.material == mat:
+                                slot.material = cleanMat
+                    break
+
+    for mat in list(bpy.data.materials):
+        if mat not in cleanMaterials:
+            bpy.data.materials.remove(mat)
+            replaced_count += 1
+
+    return replaced_count
+
+
+def scene_state():
+    """Slot assignments and remaining materials, for comparing implementations"""
+    slots = {obj.name: tuple(slot.material.name if slot.material else None for slot in obj.material_slots)
+             for obj in bpy.data.objects}
+    return slots, sorted(mat.name for mat in bpy.data.materials)
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="bench_clean_materials")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000, 50000])
+    parser.add_argument("--legacy-max", type=int, default=5000)
+    args = parser.parse_args(get_script_args())
+
+    checks = load_checks_module()
+
+    print(f"{'materials':>10} {'legacy ms':>12} {'indexed ms':>12} {'removed':>8}")
+    for size in args.sizes:
+        legacy_time = None
+        legacy_state = None
+        if size <= args.legacy_max:
+            legacy_time, _ = timed(legacy_clean_materials, setup=scene_setup(size))
+            legacy_state = scene_state()
+
+        indexed_time, removed = timed(checks.clean_duplicate_materials, setup=scene_setup(size))
+
+        if legacy_state is not None and scene_state() != legacy_state:
+            print(f"MISMATCH at {size} materials")
+            sys.exit(1)
+
+        legacy_text = f"{legacy_time * 1000:>12.1f}" if legacy_time is not None else f"{'-':>12}"
+        print(f"{size:>10} {legacy_text} {indexed_time * 1000:>12.1f} {removed:>8}")
+
+
+if __name__ == "__main__":
+    main()
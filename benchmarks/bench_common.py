@@ -0,0 +1,29 @@
+""" Shared helpers for the headless benchmarks (run inside Blender) """
+
+import os
+import sys
+import time
+
+import bpy
+
+# BBG.py is loaded by the same helper as the headless add-on scripts
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "BBG", "main"))
+from script_common import get_script_args, load_checks_module
+
+
+def empty_scene():
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+
+
+def timed(function, *args, repeat=1, setup=None):
+    """Best time of repeat runs and the last result, setup() runs before each run"""
+    best = None
+    result = None
+    for _ in range(repeat):
+        if setup is not None:
+            args = setup()
+        start = time.perf_counter()
+        result = function(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
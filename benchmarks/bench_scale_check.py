@@ -0,0 +1,94 @@
+""" Benchmark: bulk (foreach_get + NumPy) vs per-object world-scale check
+
+Usage:
+    blender --background --factory-startup --python benchmarks/bench_scale_check.py -- [--sizes 1000 10000 50000]
+
+Builds scenes of instanced props (one shared mesh), some of them scaled directly
+or through a scaled parent, some hidden, and checks both paths return the same
+objects. Times the bare scale test and the Check Scales operator path
+(visible_scale_errors, visible objects only) against a per-object loop.
+"""
+
+import argparse
+import os
+import random
+import sys
+
+import bpy
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from bench_common import empty_scene, get_script_args, load_checks_module, timed
+
+
+def build_scene(count, seed=0):
+    """count instanced props, ~5% scaled, ~5% under a scaled parent, ~10% hidden"""
+    empty_scene()
+    rng = random.Random(seed)
+
+    mesh = bpy.data.meshes.new("Prop")
+    mesh.from_pydata([(0, 0, 0), (1, 0, 0), (0, 1, 0)], [], [(0, 1, 2)])
+    collection = bpy.context.scene.collection
+
+    parent = bpy.data.objects.new("ScaledParent", None)
+    parent.scale = (2.0, 2.0, 2.0)
+    collection.objects.link(parent)
+
+    for i in range(count):
+        obj = bpy.data.objects.new(f"Prop_{i}", mesh)
+        obj.location = (rng.uniform(-100, 100), rng.uniform(-100, 100), 0)
+        obj.rotation_euler = (0, 0, rng.uniform(0, 6.28))
+        roll = rng.random()
+        if roll < 0.05:
+            obj.scale = (1.0, rng.uniform(0.5, 1.5), 1.0)
+        elif roll < 0.10:
+            obj.parent = parent
+        elif roll < 0.15:
+            # Within tolerance, must pass
+            obj.scale = (1.0 + 5e-4, 1.0, 1.0 - 5e-4)
+        collection.objects.link(obj)
+        if rng.random() < 0.10:
+            obj.hide_set(True)
+
+    bpy.context.view_layer.update()
+
+
+def visible_scale_errors_per_object(checks, view_layer):
+    """Per-object operator path: visibility and scale of every object"""
+    return [obj for obj in view_layer.objects
+            if obj.visible_get(view_layer=view_layer) and not checks.is_unit_scale(obj.matrix_world.to_scale())]
+
+
+def main():
+    args = get_script_args()
+    parser = argparse.ArgumentParser(prog="bench_scale_check")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(args)
+
+    checks = load_checks_module()
+
+    print(f"{'path':<10} {'objects':>10} {'per-object ms':>15} {'bulk ms':>10} {'speedup':>8} {'errors':>8}")
+    for size in args.sizes:
+        build_scene(size)
+        view_layer = bpy.context.view_layer
+        layer_objects = view_layer.objects
+
+        per_object_time, per_object_result = timed(checks.scale_error_indices_per_object, list(layer_objects), repeat=args.repeat)
+        bulk_time, bulk_result = timed(checks.scale_error_indices, layer_objects, repeat=args.repeat)
+        if list(bulk_result) != per_object_result:
+            print(f"MISMATCH at {size} objects: {len(bulk_result)} bulk vs {len(per_object_result)} per-object")
+            sys.exit(1)
+        print(f"{'scales':<10} {size:>10} {per_object_time * 1000:>15.2f} {bulk_time * 1000:>10.2f} "
+              f"{per_object_time / max(bulk_time, 1e-9):>7.1f}x {len(bulk_result):>8}")
+
+        per_object_time, per_object_result = timed(visible_scale_errors_per_object, checks, view_layer, repeat=args.repeat)
+        bulk_time, bulk_result = timed(checks.visible_scale_errors, view_layer, repeat=args.repeat)
+        if bulk_result != per_object_result:
+            print(f"MISMATCH at {size} objects: {len(bulk_result)} operator vs {len(per_object_result)} per-object")
+            sys.exit(1)
+        print(f"{'operator':<10} {size:>10} {per_object_time * 1000:>15.2f} {bulk_time * 1000:>10.2f} "
+              f"{per_object_time / max(bulk_time, 1e-9):>7.1f}x {len(bulk_result):>8}")
+
+
+if __name__ == "__main__":
+    main()
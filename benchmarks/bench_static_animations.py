@@ -0,0 +1,102 @@
+""" Benchmark: MarkStaticAnimations on baked clips (foreach_get engine vs per-key loop)
+
+Usage:
+    blender --background --factory-startup --python benchmarks/bench_static_animations.py -- [--objects 50] [--frames 1000 10000]
+
+Each object gets six baked location/rotation curves with a key on every frame.
+Half of the objects hold still at start and end (static), half move. Both
+implementations run on the same scene and the resulting keys are compared.
+"""
+
+import argparse
+import math
+import os
+import sys
+
+import bpy
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from bench_common import get_script_args, load_checks_module, timed
+from scene_generators import generate_baked_animations
+
+
+def legacy_mark_static(objects):
+    """Per-key implementation MarkStaticAnimations used before"""
+    shift_amount = 0.00001
+    for obj in objects:
+        if obj.animation_data and obj.animation_data.action:
+            static = True
+            for fcurve in obj.animation_data.action.fcurves:
+                if fcurve.data_path not in {"location", "rotation_euler"}:
+                    continue
+                key_val_at_zero = key_val_at_one = key_val_at_end = key_val_at_endplus = None
+                frames = sorted(kp.co.x for kp in fcurve.keyframe_points)
+                if len(frames) >= 2:
+                    end_frame = frames[-1]
+                    endplus_frame = frames[-2]
+                else:
+                    end_frame = endplus_frame = None
+                for kp in fcurve.keyframe_points:
+                    frame = kp.co.x
+                    if abs(frame - 0) < 1e-4:
+                        key_val_at_zero = kp.co.y
+                    elif abs(frame - 1) < 1e-4:
+                        key_val_at_one = kp.co.y
+                    elif end_frame is not None and abs(frame - end_frame) < 1e-4:
+                        key_val_at_end = kp.co.y
+                    elif endplus_frame is not None and abs(frame - endplus_frame) < 1e-4:
+                        key_val_at_endplus = kp.co.y
+                if None in (key_val_at_zero, key_val_at_one, key_val_at_end, key_val_at_endplus):
+                    static = False
+                    break
+                if abs(key_val_at_zero - key_val_at_one) > 1e-4 or abs(key_val_at_end - key_val_at_endplus) > 1e-4:
+                    static = False
+                    break
+
+            if static:
+                fcurves = obj.animation_data.action.fcurves
+                for frame, source in ((0, 1), (end_frame, endplus_frame)):
+                    obj.location = [fcurves[i].evaluate(source) + shift_amount for i in range(3)]
+                    obj.rotation_euler = [fcurves[i].evaluate(source) + shift_amount for i in range(3, 6)]
+                    obj.keyframe_insert(data_path="location", frame=frame)
+                    obj.keyframe_insert(data_path="rotation_euler", frame=frame)
+
+
+def start_end_values(objects):
+    """Key values at the first and last frame of every curve"""
+    values = []
+    for obj in objects:
+        for fcurve in obj.animation_data.action.fcurves:
+            points = fcurve.keyframe_points
+            values.extend((points[0].co.y, points[-1].co.y))
+    return values
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="bench_static_animations")
+    parser.add_argument("--objects", type=int, default=50)
+    parser.add_argument("--frames", type=int, nargs="+", default=[1000, 10000])
+    args = parser.parse_args(get_script_args())
+
+    checks = load_checks_module()
+
+    def mark_all(objects):
+        return sum(checks.mark_static_animation(obj.animation_data.action) for obj in objects)
+
+    print(f"{'frames':>8} {'objects':>8} {'legacy ms':>12} {'engine ms':>12} {'marked':>8}")
+    for frame_count in args.frames:
+        legacy_time, _ = timed(legacy_mark_static, setup=lambda: (generate_baked_animations(args.objects, frame_count),))
+        legacy_values = start_end_values(bpy.data.objects)
+
+        engine_time, marked = timed(mark_all, setup=lambda: (generate_baked_animations(args.objects, frame_count),))
+        engine_values = start_end_values(bpy.data.objects)
+
+        if any(not math.isclose(a, b, abs_tol=1e-6) for a, b in zip(legacy_values, engine_values)):
+            print(f"MISMATCH at {frame_count} frames")
+            sys.exit(1)
+
+        print(f"{frame_count:>8} {args.objects:>8} {legacy_time * 1000:>12.1f} {engine_time * 1000:>12.1f} {marked:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,285 @@
+""" Benchmark suite: every check and cleanup step on synthetic scenes of growing size
+
+Usage:
+    blender --background --factory-startup --python benchmarks/bench_suite.py -- [options]
+
+Options:
+    --sizes N [N ...]       Scene sizes, objects per scene (default 100 1000 10000)
+    --cases NAME [...]      Run only these cases (default all, see --list)
+    --repeat N              Timed runs per case and size, best time counts (default 3)
+    --frames N              Keys per baked animation curve (default 2000)
+    --depth N               Parent chain depth of the hierarchy scenes (default 32)
+    --baseline PATH         Baseline file (default benchmarks/baselines.json)
+    --save-baseline         Store this run as the baseline of this machine and Blender version
+    --compare PATH          Compare against a run written with --json instead of the baseline file
+    --tolerance X           Fail when a case is X times slower than its baseline (default 1.5)
+    --json PATH             Write this run as JSON
+    --list                  List the cases and exit
+
+Baselines are kept per machine and Blender version. Compare only runs made on
+the same machine. Exits with 1 when a case regresses past the tolerance.
+
+Catching a regression:
+    1. On the reference revision (e.g. main), record a baseline for this machine:
+           blender ... bench_suite.py -- --save-baseline
+       or keep the run as a file:
+           blender ... bench_suite.py -- --json main.json
+    2. On the changed revision, run the suite again. It compares against the
+       recorded baseline automatically, or against the file with:
+           blender ... bench_suite.py -- --compare main.json --tolerance 1.3
+    Cases missing from the baseline are timed but not compared.
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+
+import bpy
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from bench_common import get_script_args, load_checks_module, timed
+import scene_generators as gen
+
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines.json")
+
+# Scenes with heavy generators (real meshes, baked curves) are scaled down
+ANIMATION_DIVISOR = 100
+LOD_DIVISOR = 20
+
+
+#---------------------------------------------------
+# Cases
+#---------------------------------------------------
+# name -> (setup(checks, size, args) -> function arguments, function(checks) -> timed function)
+
+def index_setup(checks, size, args):
+    gen.generate_objects(size)
+    return (bpy.context, 'OP1')
+
+
+def index_records_setup(checks, size, args):
+    gen.generate_objects(size)
+    index = checks.SceneIndex(bpy.context, 'OP1')
+    return (index,)
+
+
+def check_records_setup(checks, size, args):
+    gen.generate_objects(size, shared_mesh=False)
+    return (checks.SceneIndex(bpy.context, 'OP1').check_records,)
+
+
+def hierarchy_setup(checks, size, args):
+    gen.generate_hierarchy(size, depth=args.depth)
+    return (checks.SceneIndex(bpy.context, 'OP2'),)
+
+
+def texture_records_setup(checks, size, args):
+    gen.generate_image_duplicates(size)
+    return (checks.SceneIndex(bpy.context, 'OP1').check_records,)
+
+
+def material_duplicates_setup(checks, size, args):
+    gen.generate_material_duplicates(size)
+    return (bpy.data.objects, gen.COLLIDER_NAME, True)
+
+
+def image_duplicates_setup(checks, size, args):
+    gen.generate_image_duplicates(size)
+    return ()
+
+
+def static_animations_setup(checks, size, args):
+    objects = gen.generate_baked_animations(max(1, size // ANIMATION_DIVISOR), args.frames)
+    return ([obj.animation_data.action for obj in objects],)
+
+
+def select_static_setup(checks, size, args):
+    objects = gen.generate_baked_animations(max(1, size // ANIMATION_DIVISOR), args.frames)
+    actions = [obj.animation_data.action for obj in objects]
+    for action in actions:
+        checks.mark_static_animation(action)
+    return (actions,)
+
+
+def image_files_setup(checks, size, args):
+    gen.generate_image_files(size, args.image_dir)
+    return ()
+
+
+def merge_animations_setup(checks, size, args):
+    target_root, animation_root = gen.generate_animation_merge(max(1, size // 10))
+    return (target_root, [animation_root])
+
+
+def lod_chains_setup(checks, size, args):
+    return (gen.generate_lod_chains(max(1, size // 4)),)
+
+
+def lod_toggle_setup(checks, size, args, level_collections=False):
+    gen.generate_lod_chains(max(1, size // 4), level_collections=level_collections)
+    registry = checks.LODRegistry()
+    registry.rebuild()
+    return (registry, registry.get_levels())
+
+
+def lod_toggle_collections_setup(checks, size, args):
+    return lod_toggle_setup(checks, size, args, level_collections=True)
+
+
+def lod_build_setup(checks, size, args):
+    sources = gen.generate_lod_sources(max(1, size // LOD_DIVISOR))
+    collection = bpy.context.scene.collection
+    jobs = []
+    for obj in sources:
+        for level in range(1, 4):
+            lod_obj = bpy.data.objects.new(f"{obj.name}_LOD{level}", obj.data)
+            collection.objects.link(lod_obj)
+            jobs.append((lod_obj, obj.data, level))
+    return (jobs, [0.7, 0.4], 'RATIO', 1)
+
+
+def cache_key_setup(checks, size, args):
+    gen.generate_image_duplicates(size)
+    return (bpy.context, 'OP1')
+
+
+CASES = {
+    "scene_index": (index_setup, lambda checks: checks.SceneIndex),
+    "root_check": (hierarchy_setup, lambda checks: checks.root_check_report),
+    "material_check": (check_records_setup, lambda checks: lambda records: checks.check_material_format(records, 'OP1')),
+    "scale_check": (index_records_setup, lambda checks: lambda index: checks.get_objects_recursive(True, False, index)),
+    "scale_operator": (index_setup, lambda checks: lambda context, mode: checks.visible_scale_errors(context.view_layer)),
+    "texture_check": (texture_records_setup, lambda checks: lambda records: checks.check_albedo_texture_format(records, 'OP1')),
+    "texture_memory": (texture_records_setup, lambda checks: lambda records: checks.check_texture_memory(records, 2048)),
+    "draw_calls": (check_records_setup, lambda checks: checks.estimate_draw_calls),
+    "material_merges": (texture_records_setup, lambda checks: checks.suggest_material_merges),
+    "clean_materials": (material_duplicates_setup, lambda checks: checks.clean_duplicate_materials),
+    "clean_textures": (image_duplicates_setup, lambda checks: lambda: checks.remap_image_users(checks.build_image_remap_by_name())),
+    "clean_textures_content": (image_files_setup, lambda checks: lambda: checks.remap_image_users(checks.build_image_remap_by_content())),
+    "mark_static": (static_animations_setup, lambda checks: lambda actions: sum(checks.mark_static_animation(action) for action in actions)),
+    "select_static": (select_static_setup, lambda checks: lambda actions: sum(checks.has_static_shift(action) for action in actions)),
+    "merge_animations": (merge_animations_setup, lambda checks: checks.merge_animations),
+    "lod_registry": (lod_chains_setup, lambda checks: lambda objects: checks.LODRegistry().rebuild()),
+    "lod_stats": (lod_chains_setup, lambda checks: lambda objects: checks.compute_lod_stats(objects, 0.3)),
+    "lod_toggle": (lod_toggle_setup, lambda checks: lambda registry, levels: registry.set_hidden(levels, True)),
+    "lod_toggle_collections": (lod_toggle_collections_setup, lambda checks: lambda registry, levels: registry.set_hidden(levels, True)),
+    "lod_build": (lod_build_setup, lambda checks: checks.build_lod_meshes),
+    "cache_key": (cache_key_setup, lambda checks: checks.check_cache_key),
+}
+
+#---------------------------------------------------
+# /Cases
+#---------------------------------------------------
+
+
+#---------------------------------------------------
+# Baselines
+#---------------------------------------------------
+
+def get_baseline_key():
+    return f"{platform.node()}/{platform.machine()}/blender-{bpy.app.version_string}"
+
+
+def load_baselines(path):
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r') as baseline_file:
+        return json.load(baseline_file)
+
+
+def save_baseline(path, key, results):
+    baselines = load_baselines(path)
+    baselines[key] = results
+    with open(path, 'w') as baseline_file:
+        json.dump(baselines, baseline_file, indent=2, sort_keys=True)
+
+#---------------------------------------------------
+# /Baselines
+#---------------------------------------------------
+
+
+def parse_args(args):
+    parser = argparse.ArgumentParser(prog="bench_suite")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--cases", nargs="+", choices=sorted(CASES), default=list(CASES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--frames", type=int, default=2000)
+    parser.add_argument("--depth", type=int, default=32)
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--compare", dest="compare_path")
+    parser.add_argument("--tolerance", type=float, default=1.5)
+    parser.add_argument("--json", dest="json_path")
+    parser.add_argument("--list", action="store_true")
+    return parser.parse_args(args)
+
+
+def main():
+    args = parse_args(get_script_args())
+
+    if args.list:
+        print("\n".join(CASES))
+        return 0
+
+    checks = load_checks_module()
+    # check_cache_key reads the add-on settings
+    checks.RootCheckRegister()
+
+    key = get_baseline_key()
+    if args.compare_path:
+        with open(args.compare_path, 'r') as compare_file:
+            baseline = json.load(compare_file)["results"]
+        print(f"bench_suite: {key}, compared with {args.compare_path}")
+    else:
+        baseline = load_baselines(args.baseline).get(key, {})
+        print(f"bench_suite: {key}" + ("" if baseline else ", no baseline recorded (see --save-baseline)"))
+
+    results = {}
+    regressions = []
+
+    # Image files of the content hash cases
+    args.image_dir = tempfile.mkdtemp(prefix="bbg_bench_")
+
+    print(f"{'case':<24} {'size':>8} {'ms':>12} {'baseline ms':>12} {'ratio':>7}")
+    for name in args.cases:
+        setup, get_function = CASES[name]
+        function = get_function(checks)
+        for size in args.sizes:
+            seconds, _ = timed(function, repeat=args.repeat, setup=lambda: setup(checks, size, args))
+            results.setdefault(name, {})[str(size)] = seconds
+
+            baseline_seconds = baseline.get(name, {}).get(str(size))
+            baseline_text = f"{'-':>12}"
+            ratio_text = f"{'-':>7}"
+            if baseline_seconds:
+                ratio = seconds / baseline_seconds
+                baseline_text = f"{baseline_seconds * 1000:>12.2f}"
+                ratio_text = f"{ratio:>6.2f}x"
+                if ratio > args.tolerance:
+                    regressions.append(f"{name} @ {size}: {ratio:.2f}x baseline")
+
+            print(f"{name:<24} {size:>8} {seconds * 1000:>12.2f} {baseline_text} {ratio_text}")
+
+    shutil.rmtree(args.image_dir, ignore_errors=True)
+
+    if args.json_path:
+        with open(args.json_path, 'w') as result_file:
+            json.dump({"key": key, "results": results}, result_file, indent=2)
+
+    if args.save_baseline:
+        save_baseline(args.baseline, key, results)
+        print(f"bench_suite: baseline saved for {key}")
+
+    if regressions:
+        print("bench_suite: regressions\n  " + "\n  ".join(regressions))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
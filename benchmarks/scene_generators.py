@@ -0,0 +1,236 @@
+""" Parametrized synthetic scenes for the benchmarks (run inside Blender)
+
+Every generator starts from an empty factory scene, is seeded and returns the
+objects the benchmarked functions need.
+"""
+
+import os
+import random
+
+import bpy
+import numpy as np
+
+from bench_common import empty_scene
+
+
+COLLIDER_NAME = "COL_DEFAULT"
+
+
+def make_grid_mesh(name, size=4):
+    """size x size quad grid (2 * size^2 triangles)"""
+    coords = np.linspace(0.0, 1.0, size + 1)
+    xs, ys = np.meshgrid(coords, coords)
+    vertices = np.column_stack((xs.ravel(), ys.ravel(), np.zeros(xs.size)))
+
+    rows = np.arange(size)
+    corners = (rows[:, None] * (size + 1) + rows[None, :]).ravel()
+    faces = np.column_stack((corners, corners + 1, corners + size + 2, corners + size + 1))
+
+    mesh = bpy.data.meshes.new(name)
+    mesh.from_pydata(vertices.tolist(), [], faces.tolist())
+    return mesh
+
+
+def link(obj, collection=None):
+    (collection or bpy.context.scene.collection).objects.link(obj)
+    return obj
+
+
+def generate_objects(count, materials=None, shared_mesh=True, scaled_ratio=0.05, seed=0):
+    """count mesh objects under one root empty, each with one of materials"""
+    empty_scene()
+    rng = random.Random(seed)
+
+    if materials is None:
+        materials = [bpy.data.materials.new(f"GEN_Mat{i}_JK") for i in range(max(1, count // 20))]
+
+    root = link(bpy.data.objects.new("GEN_Root_UN", None))
+    mesh = make_grid_mesh("Grid") if shared_mesh else None
+
+    objects = []
+    for i in range(count):
+        obj_mesh = mesh if shared_mesh else make_grid_mesh(f"Grid{i}")
+        if not shared_mesh or not obj_mesh.materials:
+            obj_mesh.materials.append(rng.choice(materials))
+        obj = link(bpy.data.objects.new(f"GEN_Obj{i}_UN", obj_mesh))
+        obj.parent = root
+        obj.location = (rng.uniform(-50, 50), rng.uniform(-50, 50), 0.0)
+        if rng.random() < scaled_ratio:
+            obj.scale = (1.0, rng.uniform(0.5, 1.5), 1.0)
+        objects.append(obj)
+
+    # One collider, as the checks expect
+    collider = link(bpy.data.objects.new("GEN_Obj_COL", mesh or make_grid_mesh("Collider")))
+    collider.parent = root
+
+    bpy.context.view_layer.update()
+    return root, objects
+
+
+def generate_material_duplicates(count, duplicates=4, seed=0):
+    """count mesh objects (own meshes) using count materials, 1 base + duplicates .00x copies each"""
+    empty_scene()
+    materials = []
+    for i in range(max(1, count // (duplicates + 1))):
+        base = f"GEN_Mat{i}_JK"
+        materials.append(bpy.data.materials.new(base))
+        materials.extend(bpy.data.materials.new(f"{base}.{suffix:03d}") for suffix in range(1, duplicates + 1))
+    materials.append(bpy.data.materials.new(COLLIDER_NAME))
+
+    rng = random.Random(seed)
+    objects = []
+    for i in range(count):
+        mesh = bpy.data.meshes.new(f"Mesh{i}")
+        mesh.materials.append(rng.choice(materials))
+        objects.append(link(bpy.data.objects.new(f"GEN_Obj{i}_UN", mesh)))
+    return objects
+
+
+def add_image_material(name, image):
+    """Node material with an image texture node"""
+    mat = bpy.data.materials.new(name)
+    mat.use_nodes = True
+    node = mat.node_tree.nodes.new('ShaderNodeTexImage')
+    node.image = image
+    return mat
+
+
+def generate_image_duplicates(count, duplicates=3, resolution=64, seed=0):
+    """count materials on count objects, each using a base image or one of its .00x duplicates"""
+    empty_scene()
+    images = []
+    for i in range(max(1, count // (duplicates + 1))):
+        base = f"GEN_Tex{i}_JK_A"
+        images.append(bpy.data.images.new(base, resolution, resolution, alpha=i % 2 == 0))
+        images.extend(bpy.data.images.new(f"{base}.{suffix:03d}", resolution, resolution) for suffix in range(1, duplicates + 1))
+
+    rng = random.Random(seed)
+    root = link(bpy.data.objects.new("GEN_Root_UN", None))
+    objects = []
+    for i in range(count):
+        mesh = bpy.data.meshes.new(f"Mesh{i}")
+        mesh.materials.append(add_image_material(f"GEN_Tex{i}_JK", rng.choice(images)))
+        obj = link(bpy.data.objects.new(f"GEN_Obj{i}_UN", mesh))
+        obj.parent = root
+        objects.append(obj)
+    return root, objects
+
+
+def generate_image_files(count, directory, duplicates=3, resolution=64, seed=0):
+    """count file images from count / (duplicates + 1) PNG files in directory, each file loaded
+    duplicates + 1 times (same content, .00x names)"""
+    empty_scene()
+    rng = random.Random(seed)
+    images = []
+    for i in range(max(1, count // (duplicates + 1))):
+        source = bpy.data.images.new(f"GEN_Src{i}", resolution, resolution)
+        source.generated_color = (rng.random(), rng.random(), rng.random(), 1.0)
+        filepath = os.path.join(directory, f"GEN_Tex{i}_JK_A.png")
+        source.filepath_raw = filepath
+        source.file_format = 'PNG'
+        source.save()
+        bpy.data.images.remove(source)
+        images.extend(bpy.data.images.load(filepath, check_existing=False) for _ in range(duplicates + 1))
+    return images
+
+
+def generate_hierarchy(count, depth=32, stray_ratio=0.01, seed=0):
+    """count empties in chains of depth under one root, stray_ratio of them in a second root"""
+    empty_scene()
+    rng = random.Random(seed)
+    root = link(bpy.data.objects.new("GEN_Root_UN", None))
+    stray_root = link(bpy.data.objects.new("GEN_Stray_UN", None))
+
+    parent = root
+    for i in range(count):
+        if i % depth == 0:
+            parent = stray_root if rng.random() < stray_ratio else root
+        obj = link(bpy.data.objects.new(f"GEN_Node{i}", None))
+        obj.parent = parent
+        parent = obj
+
+    bpy.context.view_layer.update()
+    return root
+
+
+def generate_lod_chains(chains, levels=4, grid_size=16, instanced_ratio=0.5, level_collections=False, seed=0):
+    """chains LOD groups (_LOD0.._LODn), each level a grid of half the previous resolution.
+    level_collections puts every level in its own collection"""
+    empty_scene()
+    rng = random.Random(seed)
+    material = bpy.data.materials.new("GEN_Lod_JK")
+
+    collections = [None] * levels
+    if level_collections:
+        for level in range(levels):
+            collections[level] = bpy.data.collections.new(f"GEN_LOD{level}")
+            bpy.context.scene.collection.children.link(collections[level])
+
+    shared = {}
+    objects = []
+    for chain in range(chains):
+        # Some chains reuse the meshes of the first one (instanced props)
+        instanced = chain > 0 and rng.random() < instanced_ratio
+        for level in range(levels):
+            mesh = shared.get(level) if instanced else None
+            if mesh is None:
+                mesh = make_grid_mesh(f"GEN_Lod{chain}_LOD{level}", max(1, grid_size >> level))
+                mesh.materials.append(material)
+                shared.setdefault(level, mesh)
+            objects.append(link(bpy.data.objects.new(f"GEN_Lod{chain}_UN_LOD{level}", mesh), collections[level]))
+    return objects
+
+
+def generate_lod_sources(count, grid_size=16, instanced_ratio=0.5, seed=0):
+    """count source mesh objects for LOD generation, some sharing one mesh"""
+    empty_scene()
+    rng = random.Random(seed)
+    shared = make_grid_mesh("GEN_Shared", grid_size)
+
+    objects = []
+    for i in range(count):
+        mesh = shared if rng.random() < instanced_ratio else make_grid_mesh(f"GEN_Src{i}", grid_size)
+        objects.append(link(bpy.data.objects.new(f"GEN_Src{i}_UN", mesh)))
+    return objects
+
+
+def generate_baked_animations(count, frames, static_ratio=0.5):
+    """count empties with six baked location/rotation curves of frames keys, static_ratio hold still at both ends"""
+    empty_scene()
+    keys = np.arange(frames + 1, dtype=np.float32)
+
+    objects = []
+    for i in range(count):
+        obj = link(bpy.data.objects.new(f"GEN_Ani{i}", None))
+        action = bpy.data.actions.new(f"GEN_Action{i}")
+        obj.animation_data_create().action = action
+
+        static = i < count * static_ratio
+        for data_path in ("location", "rotation_euler"):
+            for axis in range(3):
+                values = np.sin(keys * 0.01 + axis + i).astype(np.float32)
+                if static:
+                    values[0] = values[1]
+                    values[-1] = values[-2]
+                fcurve = action.fcurves.new(data_path, index=axis)
+                fcurve.keyframe_points.add(len(keys))
+                fcurve.keyframe_points.foreach_set('co', np.column_stack((keys, values)).ravel())
+                fcurve.update()
+        objects.append(obj)
+    return objects
+
+
+def generate_animation_merge(count, frames=100):
+    """Target hierarchy of count empties and an animation hierarchy with the same names (.001)"""
+    animated = generate_baked_animations(count, frames, static_ratio=0.0)
+
+    animation_root = link(bpy.data.objects.new("GEN_Animations", None))
+    for obj in animated:
+        obj.parent = animation_root
+
+    target_root = link(bpy.data.objects.new("GEN_Target", None))
+    for obj in animated:
+        target = link(bpy.data.objects.new(obj.name, None))  # gets the .001 suffix
+        target.parent = target_root
+
+    return target_root, animation_root